@@ -1,19 +1,20 @@
 """
 Commands for deploying applications.
 """
+import sys
 from pathlib import Path
-from typing import Dict, Optional
+from typing import TYPE_CHECKING, Dict, Optional
 
 import typer
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
-from ...config.settings import get_config
-from ...docker.manager import get_docker_manager
-from ...parser.github_parser import Application
-from ...services.deployment_service import get_deployment_service
 from ...utils.logging import get_logger
+from ..helpers import fail
+
+if TYPE_CHECKING:
+    from ...parser.github_parser import Application
 
 logger = get_logger(__name__)
 console = Console()
@@ -32,6 +33,9 @@ def deploy(
     """
     Deploy a Docker application.
     """
+    from ...docker.manager import get_docker_manager
+    from ...services.deployment_service import get_deployment_service
+    
     try:
         # Get services
         deployment_service = get_deployment_service()
@@ -58,9 +62,9 @@ def deploy(
             network_override=network
         )
         
-        # Pull image if requested
+        # Pull image if requested and the registry has a newer one
         if pull:
-            docker_manager.pull_image(app.docker_url)
+            docker_manager.pull_if_stale(app.docker_url)
         
         # Ensure network exists
         if network:
@@ -73,9 +77,7 @@ def deploy(
         _show_success_message(app, deploy_dir)
         
     except Exception as e:
-        logger.error(f"Deployment failed: {str(e)}")
-        console.print(f"[red]Error:[/red] {str(e)}")
-        raise typer.Exit(1)
+        fail(f"Deployment failed: {e}")
 
 @app.command()
 def stop(
@@ -84,6 +86,9 @@ def stop(
     """
     Stop a deployed application.
     """
+    from ...docker.manager import get_docker_manager
+    from ...services.deployment_service import get_deployment_service
+    
     try:
         # Get services
         deployment_service = get_deployment_service()
@@ -101,21 +106,25 @@ def stop(
         console.print(f"[green]Successfully stopped {name}[/green]")
         
     except Exception as e:
-        logger.error(f"Failed to stop application: {str(e)}")
-        console.print(f"[red]Error:[/red] {str(e)}")
-        raise typer.Exit(1)
+        fail(f"Failed to stop application: {e}")
 
 @app.command()
 def status(
     name: Optional[str] = typer.Argument(None, help="Name of the application to check"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Query Docker for fresh status"),
 ) -> None:
     """
     Show status of deployed applications.
     """
+    from ...docker.manager import get_docker_manager
+    from ...services.deployment_service import get_deployment_service
+    
     try:
         # Get services
         deployment_service = get_deployment_service()
         docker_manager = get_docker_manager()
+        if no_cache:
+            docker_manager.clear_status_cache()
         
         if name:
             # Show status for single application
@@ -134,21 +143,27 @@ def status(
                 console.print("No applications are currently deployed")
                 return
             
+            statuses = docker_manager.get_all_container_statuses(deployments)
+            
+            # Emit plain tab-separated lines when output is piped
+            if not console.is_terminal:
+                for name, status in statuses.items():
+                    for container, state in status.items():
+                        print(f"{name}\t{container}\t{state}")
+                return
+            
             table = Table(title="Deployed Applications")
             table.add_column("Name")
             table.add_column("Status")
             
-            for name, deploy_dir in deployments.items():
-                status = docker_manager.get_container_status(deploy_dir)
+            for name, status in statuses.items():
                 for container, state in status.items():
                     table.add_row(name, state)
             
             console.print(table)
         
     except Exception as e:
-        logger.error(f"Failed to get status: {str(e)}")
-        console.print(f"[red]Error:[/red] {str(e)}")
-        raise typer.Exit(1)
+        fail(f"Failed to get status: {e}")
 
 @app.command()
 def logs(
@@ -159,6 +174,9 @@ def logs(
     """
     Show logs for a deployed application.
     """
+    from ...docker.manager import get_docker_manager
+    from ...services.deployment_service import get_deployment_service
+    
     try:
         # Get services
         deployment_service = get_deployment_service()
@@ -170,21 +188,26 @@ def logs(
             logger.error(f"Application '{name}' is not deployed")
             raise typer.Exit(1)
         
+        if follow:
+            # Pass log bytes straight through until interrupted
+            out = sys.stdout.buffer
+            try:
+                for line in docker_manager.stream_container_logs(deploy_dir, tail=tail):
+                    out.write(line)
+                    out.flush()
+            except KeyboardInterrupt:
+                pass
+            return
+        
         # Get logs
         logs = docker_manager.get_container_logs(deploy_dir, tail=tail)
         console.print(logs)
         
-        if follow:
-            # TODO: Implement log following
-            logger.warning("Log following is not yet implemented")
-        
     except Exception as e:
-        logger.error(f"Failed to get logs: {str(e)}")
-        console.print(f"[red]Error:[/red] {str(e)}")
-        raise typer.Exit(1)
+        fail(f"Failed to get logs: {e}")
 
 def _show_deployment_plan(
-    app: Application,
+    app: "Application",
     port_override: Optional[int],
     volume_override: Optional[str],
     network_override: Optional[str],
@@ -216,23 +239,27 @@ def _show_deployment_plan(
     
     console.print(table)
 
-def _show_success_message(app: Application, deploy_dir: Path) -> None:
+def _show_success_message(app: "Application", deploy_dir: Path) -> None:
     """Show success message after deployment."""
+    if not console.is_terminal:
+        print(f"Successfully deployed {app.name} to {deploy_dir}")
+        return
+    
     panel = Panel(
-        f"""
-        [green]Successfully deployed {app.name}![/green]
-        
-        Deployment directory: {deploy_dir}
-        
-        To view logs:
-            easy-docker-deploy logs {app.name}
-            
-        To check status:
-            easy-docker-deploy status {app.name}
-            
-        To stop the application:
-            easy-docker-deploy stop {app.name}
-        """,
+        "\n".join([
+            f"[green]Successfully deployed {app.name}![/green]",
+            "",
+            f"Deployment directory: {deploy_dir}",
+            "",
+            "To view logs:",
+            f"    easy-docker-deploy logs {app.name}",
+            "",
+            "To check status:",
+            f"    easy-docker-deploy status {app.name}",
+            "",
+            "To stop the application:",
+            f"    easy-docker-deploy stop {app.name}"
+        ]),
         title="Deployment Complete",
         expand=False
     )
@@ -240,6 +267,11 @@ def _show_success_message(app: Application, deploy_dir: Path) -> None:
 
 def _show_application_status(name: str, status: Dict[str, str]) -> None:
     """Show status for a single application."""
+    if not console.is_terminal:
+        for container, state in status.items():
+            print(f"{container}\t{state}")
+        return
+    
     table = Table(title=f"Status for {name}")
     table.add_column("Container")
     table.add_column("Status")
@@ -6,8 +6,8 @@ from typing import Optional
 from rich.console import Console
 from rich.table import Table
 
-from ...config.pirate import PirateConfigFactory
 from ...utils.logging import get_logger
+from ..helpers import fail
 
 # Initialize logger and console
 logger = get_logger(__name__)
@@ -21,15 +21,19 @@ def list_services(
     details: bool = typer.Option(False, "--details", "-d", help="Show detailed information")
 ) -> None:
     """List all available applications."""
+    from ...config.pirate import PirateConfigFactory
+    
     try:
-        # Create table
-        table = Table(title="Available Applications")
-        table.add_column("Name")
-        table.add_column("Description")
-        table.add_column("Category")
-        if details:
-            table.add_column("Ports")
-            table.add_column("Volumes")
+        # Only build a table for interactive terminals
+        table = None
+        if console.is_terminal:
+            table = Table(title="Available Applications")
+            table.add_column("Name")
+            table.add_column("Description")
+            table.add_column("Category")
+            if details:
+                table.add_column("Ports")
+                table.add_column("Volumes")
         
         # Add Pirate mode services
         factory = PirateConfigFactory()
@@ -55,11 +59,13 @@ def list_services(
                     ", ".join(str(v) for v in service.volumes)
                 ])
             
-            table.add_row(*row)
+            if table is None:
+                print("\t".join(row))
+            else:
+                table.add_row(*row)
         
-        console.print(table)
+        if table is not None:
+            console.print(table)
         
     except Exception as e:
-        logger.error(f"Failed to list services: {str(e)}")
-        console.print(f"[red]Error:[/red] {str(e)}")
-        raise typer.Exit(1) 
\ No newline at end of file
+        fail(f"Failed to list services: {e}")
\ No newline at end of file
@@ -1,18 +1,21 @@
 """
 Command module for Pirate mode deployment.
 """
+import logging
+import re
 import typer
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, List, Optional
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.panel import Panel
 
-from ...config.pirate import get_pirate_config
-from ...services.deployment_service import DeploymentService
+from ...utils.exceptions import DeploymentError
 from ...utils.validation import validate_path
 from ...utils.logging import get_logger
-from ...wizard.interactive import DeploymentWizard
+from ..helpers import fail
+
+if TYPE_CHECKING:
+    from rich.progress import Progress
 
 # Initialize logger and console
 logger = get_logger(__name__)
@@ -24,6 +27,25 @@ class PirateDeploymentError(Exception):
     """Custom exception for Pirate mode deployment errors."""
     pass
 
+# Words in compose output: names, paths and image references stay whole
+_OUTPUT_TOKEN_RE = re.compile(r"[\w./-]+")
+
+def _failed_services(names: List[str], output: str) -> List[str]:
+    """
+    Find the services named in docker compose error output.
+    
+    A service counts when its name appears as a whole token, or inside a
+    ``<project>-<service>-<N>`` container name; substrings such as "plex"
+    in "complex" or in a volume path do not.
+    """
+    tokens = set(_OUTPUT_TOKEN_RE.findall(output))
+    failed = []
+    for name in names:
+        container_re = re.compile(rf"[\w.-]+-{re.escape(name)}-\d+")
+        if name in tokens or any(container_re.fullmatch(token) for token in tokens):
+            failed.append(name)
+    return failed
+
 @app.command()
 def deploy(
     media_path: Optional[str] = typer.Option(None, help="Base path for media storage (will be created if it doesn't exist)"),
@@ -51,6 +73,7 @@ def deploy(
         
         if interactive:
             # Use interactive wizard
+            from ...wizard.interactive import DeploymentWizard
             wizard = DeploymentWizard()
             
             # Show welcome message
@@ -89,9 +112,7 @@ def deploy(
         _show_success_message(config)
         
     except PirateDeploymentError as e:
-        logger.error(f"Deployment failed: {str(e)}")
-        console.print(f"[red]Error:[/red] {str(e)}")
-        raise typer.Exit(1)
+        fail(f"Deployment failed: {e}")
     except Exception as e:
         logger.exception("Unexpected error during deployment")
         console.print("[red]An unexpected error occurred during deployment.[/red]")
@@ -109,11 +130,14 @@ def _setup_media_path(media_path: Optional[str]) -> Path:
             path = Path.home() / "media"
             logger.info(f"Using default media path: {path}")
         
-        # Create directory structure
-        for subdir in ["downloads", "media", "config"]:
-            subpath = path / subdir
+        # Create directory structure, skipping the ones that already exist
+        debug = logger.isEnabledFor(logging.DEBUG)
+        for subpath in [path / subdir for subdir in ("downloads", "media", "config")]:
+            if subpath.exists():
+                continue
             subpath.mkdir(parents=True, exist_ok=True)
-            logger.debug(f"Created directory: {subpath}")
+            if debug:
+                logger.debug(f"Created directory: {subpath}")
         
         validate_path(str(path))
         return path
@@ -124,13 +148,10 @@ def _setup_media_path(media_path: Optional[str]) -> Path:
 def _generate_configuration(media_path: Path, timezone: str) -> dict:
     """Generate and validate the deployment configuration."""
     try:
-        logger.info("Generating deployment configuration")
-        config = get_pirate_config(media_path)
+        from ...config.pirate import get_pirate_config
         
-        # Update timezone in all services
-        for service in config["services"].values():
-            if "environment" in service:
-                service["environment"]["TZ"] = timezone
+        logger.info("Generating deployment configuration")
+        config = get_pirate_config(media_path, timezone)
                 
         logger.debug("Configuration generated successfully")
         return config
@@ -140,38 +161,96 @@ def _generate_configuration(media_path: Path, timezone: str) -> dict:
 
 def _deploy_services(config: dict) -> None:
     """Deploy services with progress feedback."""
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+    from ...services.deployment_service import DeploymentService
+    
+    names = list(config["services"])
     try:
         deployment = DeploymentService()
         
+        # Throttle redraws; the spinner does not need the default 10 fps
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
-            console=console
+            console=console,
+            refresh_per_second=4
         ) as progress:
             # Create overall progress
             deploy_task = progress.add_task("Deploying services...", total=None)
             
-            # Deploy each service
-            for name, service in config["services"].items():
-                progress.update(deploy_task, description=f"Deploying {name}...")
-                logger.debug(f"Deploying service: {name}")
-                deployment.deploy({"services": {name: service}})
+            # Pull images concurrently so compose only has to start containers
+            _pull_images(config, progress)
+            
+            # Deploy all services with a single docker-compose invocation
+            progress.update(deploy_task, description=f"Deploying {', '.join(names)}...")
+            logger.debug(f"Deploying services: {', '.join(names)}")
+            deployment.deploy(config)
                 
             progress.update(deploy_task, description="Deployment complete!")
             
+    except PirateDeploymentError:
+        raise
+    except DeploymentError as e:
+        # Map the compose output back to the services that failed
+        failed = _failed_services(names, str(e))
+        if failed:
+            raise PirateDeploymentError(
+                f"Failed to deploy services ({', '.join(failed)}): {str(e)}"
+            )
+        raise PirateDeploymentError(f"Failed to deploy services: {str(e)}")
     except Exception as e:
         raise PirateDeploymentError(f"Failed to deploy services: {str(e)}")
 
+def _pull_images(config: dict, progress: "Progress") -> None:
+    """Pull the images for all services in parallel."""
+    from ...docker.manager import CommandError, get_docker_manager
+    
+    services = config["services"]
+    if not services:
+        return
+    
+    pull_task = progress.add_task("Pulling images...", total=len(services))
+    names_by_image = {}
+    for name, service in services.items():
+        names_by_image.setdefault(service["image"], []).append(name)
+    errors = {}
+    
+    def on_pulled(image: str, error: Optional[Exception]) -> None:
+        for name in names_by_image[image]:
+            if error is None:
+                logger.debug(f"Pulled image for service: {name}")
+            else:
+                errors[name] = str(error)
+            progress.update(pull_task, advance=1, description=f"Pulled {name}")
+    
+    try:
+        get_docker_manager().pull_images(list(names_by_image), on_pulled=on_pulled)
+    except CommandError:
+        pass  # Reported per service below
+    
+    if errors:
+        details = "; ".join(f"{name}: {error}" for name, error in errors.items())
+        raise PirateDeploymentError(f"Failed to pull images ({details})")
+
 def _show_success_message(config: dict) -> None:
     """Show deployment success message and next steps."""
+    # Build the web UI URLs from the host side of each port mapping
+    urls = {
+        name: [f"http://localhost:{p.partition(':')[0]}" for p in service.get("ports", [])]
+        for name, service in config["services"].items()
+    }
+    
+    if not console.is_terminal:
+        for name, service_urls in urls.items():
+            print(f"{name}\t{','.join(service_urls)}")
+        logger.info("Deployment completed successfully")
+        return
+    
     # Create service status table
-    services_info = []
-    for name, service in config["services"].items():
-        ports = service.get("ports", [])
-        port_info = [f"http://localhost:{p.split(':')[0]}" for p in ports]
-        services_info.append(f"• {name}")
-        if port_info:
-            services_info.append(f"  URLs: {', '.join(port_info)}")
+    services_info = [
+        f"• {name}" + (f"\n  URLs: {', '.join(service_urls)}" if service_urls else "")
+        for name, service_urls in urls.items()
+    ]
     
     # Create and show success panel
     panel = Panel(
@@ -0,0 +1,18 @@
+"""
+Helpers shared by the CLI commands.
+"""
+from typing import NoReturn
+
+import typer
+from rich.console import Console
+
+from ..utils.logging import get_logger
+
+logger = get_logger(__name__)
+console = Console()
+
+def fail(message: str, code: int = 1) -> NoReturn:
+    """Log and print an error message, then exit with the given code."""
+    logger.error(message)
+    console.print(f"[red]Error:[/red] {message}")
+    raise typer.Exit(code)
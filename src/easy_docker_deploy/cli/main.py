@@ -1,7 +1,6 @@
 """
 Main CLI module for Self-Hosted Docker Deployer.
 """
-import os
 from pathlib import Path
 from typing import Optional
 
@@ -26,13 +25,6 @@ logger = get_logger(__name__)
 app.add_typer(list_app, name="list", help="List available applications")
 app.add_typer(pirate_app, name="pirate", help="Manage pirate mode services")
 
-@app.callback()
-def callback() -> None:
-    """
-    Self-Hosted Docker Deployer - A tool for managing self-hosted applications.
-    """
-    pass
-
 @app.callback()
 def main(
     log_level: str = typer.Option(
@@ -67,9 +59,7 @@ def main(
             config.load_from_file(config_file)
         
         # Create necessary directories
-        os.makedirs(config.cache_dir, exist_ok=True)
-        os.makedirs(config.log_dir, exist_ok=True)
-        os.makedirs(config.default_volume_base, exist_ok=True)
+        config.ensure_dirs()
         
         logger.debug("CLI initialized successfully")
         
@@ -2,10 +2,41 @@
 Docker configuration classes and utilities.
 """
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
-import yaml
+from typing import Dict, List, Optional, TextIO, Tuple
 
-@dataclass
+from ..utils.compat import DATACLASS_SLOTS, yaml_safe_codec
+
+# (attribute, compose key) pairs only emitted when set
+_OPTIONAL_FIELDS = (
+    ("ports", "ports"),
+    ("volumes", "volumes"),
+    ("environment", "environment"),
+    ("depends_on", "depends_on"),
+    ("command", "command"),
+    ("entrypoint", "entrypoint"),
+)
+
+# (attribute, compose key, default factory) triples read by from_compose_dict
+_FROM_COMPOSE_FIELDS = (
+    ("ports", "ports", list),
+    ("volumes", "volumes", list),
+    ("environment", "environment", dict),
+    ("restart_policy", "restart", lambda: "unless-stopped"),
+    ("networks", "networks", lambda: ["default"]),
+    ("depends_on", "depends_on", list),
+    ("command", "command", lambda: None),
+    ("entrypoint", "entrypoint", lambda: None),
+)
+
+# Networks section for the default network list; shared, so never mutated
+_DEFAULT_NETWORKS = {"default": {"external": True}}
+
+def _yaml_codec():
+    """Import PyYAML on first use, with the fastest available safe dumper/loader."""
+    import yaml
+    return (yaml, *yaml_safe_codec())
+
+@dataclass(**DATACLASS_SLOTS)
 class DockerConfig:
     """Configuration for a Docker deployment."""
     
@@ -20,8 +51,33 @@ class DockerConfig:
     command: Optional[str] = None
     entrypoint: Optional[str] = None
     
+    # Last (field snapshot, YAML) pair produced by to_compose_yaml
+    _yaml_cache: Optional[Tuple[tuple, str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    
+    def _snapshot(self) -> tuple:
+        """Get an immutable snapshot of the fields that shape the compose output."""
+        return (
+            self.image,
+            self.container_name,
+            tuple(self.ports),
+            tuple(self.volumes),
+            tuple(self.environment.items()),
+            self.restart_policy,
+            tuple(self.networks),
+            tuple(self.depends_on),
+            self.command,
+            self.entrypoint
+        )
+    
     def to_compose_dict(self) -> Dict:
-        """Convert configuration to docker-compose format dictionary."""
+        """
+        Convert configuration to docker-compose format dictionary.
+        
+        The networks section may be shared between calls, so the returned
+        dictionary must not be modified in place.
+        """
         compose_config = {
             "version": "3.8",
             "services": {
@@ -32,32 +88,62 @@ class DockerConfig:
                     "networks": self.networks
                 }
             },
-            "networks": {
-                network: {"external": True} for network in self.networks
-            }
+            "networks": (
+                _DEFAULT_NETWORKS if self.networks == ["default"]
+                else {network: {"external": True} for network in self.networks}
+            )
         }
         
         service = compose_config["services"][self.container_name]
         
         # Add optional configurations
-        if self.ports:
-            service["ports"] = self.ports
-        if self.volumes:
-            service["volumes"] = self.volumes
-        if self.environment:
-            service["environment"] = self.environment
-        if self.depends_on:
-            service["depends_on"] = self.depends_on
-        if self.command:
-            service["command"] = self.command
-        if self.entrypoint:
-            service["entrypoint"] = self.entrypoint
+        for attr, key in _OPTIONAL_FIELDS:
+            value = getattr(self, attr)
+            if value:
+                service[key] = value
             
         return compose_config
     
     def to_compose_yaml(self) -> str:
-        """Convert configuration to docker-compose.yml format."""
-        return yaml.dump(self.to_compose_dict(), default_flow_style=False, sort_keys=False)
+        """
+        Convert configuration to docker-compose.yml format.
+        
+        The result is cached until one of the fields changes.
+        """
+        snapshot = self._snapshot()
+        if self._yaml_cache is not None and self._yaml_cache[0] == snapshot:
+            return self._yaml_cache[1]
+        
+        yaml, SafeDumper, _ = _yaml_codec()
+        compose_yaml = yaml.dump(
+            self.to_compose_dict(),
+            Dumper=SafeDumper,
+            default_flow_style=False,
+            sort_keys=False
+        )
+        self._yaml_cache = (snapshot, compose_yaml)
+        return compose_yaml
+    
+    def write_compose(self, stream: TextIO) -> None:
+        """
+        Write the docker-compose.yml content to an open text stream.
+        
+        Cached YAML from to_compose_yaml is reused while the fields are
+        unchanged; otherwise the dumper emits straight into the stream
+        without building the document as one string first.
+        """
+        if self._yaml_cache is not None and self._yaml_cache[0] == self._snapshot():
+            stream.write(self._yaml_cache[1])
+            return
+        
+        yaml, SafeDumper, _ = _yaml_codec()
+        yaml.dump(
+            self.to_compose_dict(),
+            stream,
+            Dumper=SafeDumper,
+            default_flow_style=False,
+            sort_keys=False
+        )
     
     @classmethod
     def from_compose_dict(cls, compose_dict: Dict) -> "DockerConfig":
@@ -74,18 +160,15 @@ class DockerConfig:
         return cls(
             image=service["image"],
             container_name=service.get("container_name", service_name),
-            ports=service.get("ports", []),
-            volumes=service.get("volumes", []),
-            environment=service.get("environment", {}),
-            restart_policy=service.get("restart", "unless-stopped"),
-            networks=service.get("networks", ["default"]),
-            depends_on=service.get("depends_on", []),
-            command=service.get("command"),
-            entrypoint=service.get("entrypoint")
+            **{
+                attr: service[key] if key in service else default()
+                for attr, key, default in _FROM_COMPOSE_FIELDS
+            }
         )
     
     @classmethod
     def from_compose_yaml(cls, compose_yaml: str) -> "DockerConfig":
         """Create configuration from docker-compose.yml format string."""
-        compose_dict = yaml.safe_load(compose_yaml)
+        yaml, _, SafeLoader = _yaml_codec()
+        compose_dict = yaml.load(compose_yaml, Loader=SafeLoader)
         return cls.from_compose_dict(compose_dict) 
\ No newline at end of file
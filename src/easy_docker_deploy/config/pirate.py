@@ -2,32 +2,40 @@
 Configuration module for Pirate mode services and settings.
 This module provides preset configurations for media automation services.
 """
-from dataclasses import dataclass
-from typing import Dict, List, Optional, Any
+import functools
+import os
+import re
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Sequence
 from pathlib import Path
 
+from ..utils.compat import DATACLASS_SLOTS
 from ..utils.logging import get_logger
 from ..config.settings import get_config
 
 logger = get_logger(__name__)
 
-@dataclass
+# Matches the path placeholders used in service volume definitions
+_PATH_PLACEHOLDER = re.compile(r"\{(downloads|media|config)\}")
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class ServiceConfig:
     """Configuration for a single service."""
     name: str
     description: str
     image: str
-    ports: List[str]
-    volumes: List[str]
-    environment: Dict[str, str]
-    comments: Optional[Dict[str, str]] = None
+    ports: Sequence[str]
+    volumes: Sequence[str]
+    environment: Mapping[str, str]
+    comments: Optional[Mapping[str, str]] = None
 
 @dataclass
 class PirateConfig:
     """Complete configuration for Pirate mode."""
     services: List[ServiceConfig]
     base_path: Path
-    network_name: str = get_config().default_network
+    network_name: str = field(default_factory=lambda: get_config().default_network)
     compose_version: str = "3.8"
 
     def to_dict(self) -> Dict[str, Any]:
@@ -48,33 +56,42 @@ class PirateConfig:
         }
     
     def _format_service_config(self, service: ServiceConfig) -> Dict[str, Any]:
-        """Format a service configuration with proper paths."""
-        paths = self._get_path_mappings()
+        """
+        Format a service configuration with proper paths.
+        
+        Args:
+            service: Service to format
+            
+        Returns:
+            Service section of the compose configuration
+        """
+        paths = self._path_mappings
         
         # Format volumes with proper paths
-        volumes = []
-        for volume in service.volumes:
-            for key, path in paths.items():
-                volume = volume.replace(f"{{{key}}}", path)
-            volumes.append(volume)
+        volumes = [
+            _PATH_PLACEHOLDER.sub(lambda m: paths[m.group(1)], volume)
+            for volume in service.volumes
+        ]
         
         config = {
             "image": service.image,
-            "ports": service.ports,
+            "ports": list(service.ports),
             "volumes": volumes,
-            "environment": service.environment,
+            "environment": dict(service.environment),
             "networks": [self.network_name],
             "restart": "unless-stopped"
         }
         
         return config
     
-    def _get_path_mappings(self) -> Dict[str, str]:
+    @functools.cached_property
+    def _path_mappings(self) -> Dict[str, str]:
         """Get path mappings for volume configuration."""
+        base = os.fspath(self.base_path)
         return {
-            "downloads": str(self.base_path / "downloads"),
-            "media": str(self.base_path / "media"),
-            "config": str(self.base_path / "config")
+            "downloads": os.path.join(base, "downloads"),
+            "media": os.path.join(base, "media"),
+            "config": os.path.join(base, "config")
         }
     
     def _generate_volume_config(self) -> Dict[str, Dict[str, str]]:
@@ -84,167 +101,168 @@ class PirateConfig:
             for name in ["downloads", "media", "config"]
         }
 
+# Environment common to the linuxserver.io images
+_DEFAULT_ENV = MappingProxyType({
+    "PUID": "1000",
+    "PGID": "1000",
+    "TZ": "Etc/UTC"
+})
+
+# Preset service definitions, shared by every configuration
+_PLEX = ServiceConfig(
+    name="plex",
+    description="Media streaming and organization server",
+    image="linuxserver/plex:latest",
+    ports=("32400:32400",),
+    volumes=(
+        "{config}:/config",
+        "{media}:/media"
+    ),
+    environment=MappingProxyType({**_DEFAULT_ENV, "VERSION": "docker"}),
+    comments=MappingProxyType({
+        "description": "Plex Media Server - Stream your media collection",
+        "ports": "Port 32400 is used for the web interface and streaming",
+        "volumes": "Config stores Plex settings, Media contains your media files",
+        "environment": "PUID/PGID ensure proper file permissions"
+    })
+)
+
+_OVERSEERR = ServiceConfig(
+    name="overseerr",
+    description="Media request and discovery",
+    image="linuxserver/overseerr:latest",
+    ports=("5055:5055",),
+    volumes=(
+        "{config}:/config",
+    ),
+    environment=_DEFAULT_ENV,
+    comments=MappingProxyType({
+        "description": "Overseerr - Request and discover new media",
+        "ports": "Port 5055 is used for the web interface",
+        "volumes": "Config stores Overseerr settings and database",
+        "environment": "PUID/PGID ensure proper file permissions"
+    })
+)
+
+_SONARR = ServiceConfig(
+    name="sonarr",
+    description="TV series management",
+    image="linuxserver/sonarr:latest",
+    ports=("8989:8989",),
+    volumes=(
+        "{config}:/config",
+        "{downloads}:/downloads",
+        "{media}:/media"
+    ),
+    environment=_DEFAULT_ENV,
+    comments=MappingProxyType({
+        "description": "Sonarr - Automated TV series management",
+        "ports": "Port 8989 is used for the web interface",
+        "volumes": "Config stores settings, Downloads for temporary files, Media for TV shows",
+        "environment": "PUID/PGID ensure proper file permissions"
+    })
+)
+
+_RADARR = ServiceConfig(
+    name="radarr",
+    description="Movie collection management",
+    image="linuxserver/radarr:latest",
+    ports=("7878:7878",),
+    volumes=(
+        "{config}:/config",
+        "{downloads}:/downloads",
+        "{media}:/media"
+    ),
+    environment=_DEFAULT_ENV,
+    comments=MappingProxyType({
+        "description": "Radarr - Automated movie management",
+        "ports": "Port 7878 is used for the web interface",
+        "volumes": "Config stores settings, Downloads for temporary files, Media for movies",
+        "environment": "PUID/PGID ensure proper file permissions"
+    })
+)
+
+_PROWLARR = ServiceConfig(
+    name="prowlarr",
+    description="Indexer management",
+    image="linuxserver/prowlarr:latest",
+    ports=("9696:9696",),
+    volumes=(
+        "{config}:/config",
+    ),
+    environment=_DEFAULT_ENV,
+    comments=MappingProxyType({
+        "description": "Prowlarr - Indexer management and proxy",
+        "ports": "Port 9696 is used for the web interface",
+        "volumes": "Config stores settings and indexer data",
+        "environment": "PUID/PGID ensure proper file permissions"
+    })
+)
+
+_QBITTORRENT = ServiceConfig(
+    name="qbittorrent",
+    description="Download client",
+    image="linuxserver/qbittorrent:latest",
+    ports=("8080:8080", "6881:6881", "6881:6881/udp",),
+    volumes=(
+        "{config}:/config",
+        "{downloads}:/downloads"
+    ),
+    environment=MappingProxyType({**_DEFAULT_ENV, "WEBUI_PORT": "8080"}),
+    comments=MappingProxyType({
+        "description": "qBittorrent - Download client with web interface",
+        "ports": "Port 8080 for web UI, 6881 for torrent communication",
+        "volumes": "Config stores settings, Downloads for downloaded files",
+        "environment": "PUID/PGID ensure proper file permissions"
+    })
+)
+
 class PirateConfigFactory:
     """Factory for creating Pirate mode configurations."""
     
     @staticmethod
     def create_plex() -> ServiceConfig:
         """Create Plex media server configuration."""
-        return ServiceConfig(
-            name="plex",
-            description="Media streaming and organization server",
-            image="linuxserver/plex:latest",
-            ports=["32400:32400"],
-            volumes=[
-                "{config}:/config",
-                "{media}:/media"
-            ],
-            environment={
-                "PUID": "1000",
-                "PGID": "1000",
-                "TZ": "Etc/UTC",
-                "VERSION": "docker"
-            },
-            comments={
-                "description": "Plex Media Server - Stream your media collection",
-                "ports": "Port 32400 is used for the web interface and streaming",
-                "volumes": "Config stores Plex settings, Media contains your media files",
-                "environment": "PUID/PGID ensure proper file permissions"
-            }
-        )
+        return _PLEX
     
     @staticmethod
     def create_overseerr() -> ServiceConfig:
         """Create Overseerr configuration."""
-        return ServiceConfig(
-            name="overseerr",
-            description="Media request and discovery",
-            image="linuxserver/overseerr:latest",
-            ports=["5055:5055"],
-            volumes=[
-                "{config}:/config"
-            ],
-            environment={
-                "PUID": "1000",
-                "PGID": "1000",
-                "TZ": "Etc/UTC"
-            },
-            comments={
-                "description": "Overseerr - Request and discover new media",
-                "ports": "Port 5055 is used for the web interface",
-                "volumes": "Config stores Overseerr settings and database",
-                "environment": "PUID/PGID ensure proper file permissions"
-            }
-        )
+        return _OVERSEERR
     
     @staticmethod
     def create_sonarr() -> ServiceConfig:
         """Create Sonarr configuration."""
-        return ServiceConfig(
-            name="sonarr",
-            description="TV series management",
-            image="linuxserver/sonarr:latest",
-            ports=["8989:8989"],
-            volumes=[
-                "{config}:/config",
-                "{downloads}:/downloads",
-                "{media}:/media"
-            ],
-            environment={
-                "PUID": "1000",
-                "PGID": "1000",
-                "TZ": "Etc/UTC"
-            },
-            comments={
-                "description": "Sonarr - Automated TV series management",
-                "ports": "Port 8989 is used for the web interface",
-                "volumes": "Config stores settings, Downloads for temporary files, Media for TV shows",
-                "environment": "PUID/PGID ensure proper file permissions"
-            }
-        )
+        return _SONARR
     
     @staticmethod
     def create_radarr() -> ServiceConfig:
         """Create Radarr configuration."""
-        return ServiceConfig(
-            name="radarr",
-            description="Movie collection management",
-            image="linuxserver/radarr:latest",
-            ports=["7878:7878"],
-            volumes=[
-                "{config}:/config",
-                "{downloads}:/downloads",
-                "{media}:/media"
-            ],
-            environment={
-                "PUID": "1000",
-                "PGID": "1000",
-                "TZ": "Etc/UTC"
-            },
-            comments={
-                "description": "Radarr - Automated movie management",
-                "ports": "Port 7878 is used for the web interface",
-                "volumes": "Config stores settings, Downloads for temporary files, Media for movies",
-                "environment": "PUID/PGID ensure proper file permissions"
-            }
-        )
+        return _RADARR
     
     @staticmethod
     def create_prowlarr() -> ServiceConfig:
         """Create Prowlarr configuration."""
-        return ServiceConfig(
-            name="prowlarr",
-            description="Indexer management",
-            image="linuxserver/prowlarr:latest",
-            ports=["9696:9696"],
-            volumes=[
-                "{config}:/config"
-            ],
-            environment={
-                "PUID": "1000",
-                "PGID": "1000",
-                "TZ": "Etc/UTC"
-            },
-            comments={
-                "description": "Prowlarr - Indexer management and proxy",
-                "ports": "Port 9696 is used for the web interface",
-                "volumes": "Config stores settings and indexer data",
-                "environment": "PUID/PGID ensure proper file permissions"
-            }
-        )
+        return _PROWLARR
     
     @staticmethod
     def create_qbittorrent() -> ServiceConfig:
         """Create qBittorrent configuration."""
-        return ServiceConfig(
-            name="qbittorrent",
-            description="Download client",
-            image="linuxserver/qbittorrent:latest",
-            ports=["8080:8080", "6881:6881", "6881:6881/udp"],
-            volumes=[
-                "{config}:/config",
-                "{downloads}:/downloads"
-            ],
-            environment={
-                "PUID": "1000",
-                "PGID": "1000",
-                "TZ": "Etc/UTC",
-                "WEBUI_PORT": "8080"
-            },
-            comments={
-                "description": "qBittorrent - Download client with web interface",
-                "ports": "Port 8080 for web UI, 6881 for torrent communication",
-                "volumes": "Config stores settings, Downloads for downloaded files",
-                "environment": "PUID/PGID ensure proper file permissions"
-            }
-        )
+        return _QBITTORRENT
 
-def get_pirate_config(media_path: Optional[Path] = None) -> Dict[str, Any]:
+def get_pirate_config(
+    media_path: Optional[Path] = None,
+    timezone: str = "Etc/UTC"
+) -> Dict[str, Any]:
     """
     Get the complete Pirate mode configuration.
     
+    The service presets are immutable module constants; the dictionary built
+    from them is new on every call, so callers may modify it freely.
+    
     Args:
         media_path: Optional path for media storage
+        timezone: Timezone for the services (e.g. America/New_York)
         
     Returns:
         Dictionary containing the complete configuration
@@ -252,17 +270,17 @@ def get_pirate_config(media_path: Optional[Path] = None) -> Dict[str, Any]:
     if media_path is None:
         media_path = Path.home() / "media"
     
-    factory = PirateConfigFactory()
     config = PirateConfig(
-        services=[
-            factory.create_plex(),
-            factory.create_overseerr(),
-            factory.create_sonarr(),
-            factory.create_radarr(),
-            factory.create_prowlarr(),
-            factory.create_qbittorrent()
-        ],
+        services=[_PLEX, _OVERSEERR, _SONARR, _RADARR, _PROWLARR, _QBITTORRENT],
         base_path=media_path
     )
     
-    return config.to_dict() 
\ No newline at end of file
+    compose_config = config.to_dict()
+    
+    # Each service has its own environment dictionary, so this never
+    # touches the service defaults or another service
+    for service in compose_config["services"].values():
+        if "environment" in service:
+            service["environment"]["TZ"] = timezone
+    
+    return compose_config 
\ No newline at end of file
@@ -1,14 +1,36 @@
 """
 Configuration settings for the application.
 """
+import functools
+import json
 import os
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Dict, List, Tuple, Union
 
 import yaml
 
-@dataclass
+from ..utils.compat import DATACLASS_SLOTS, yaml_safe_codec
+
+SafeDumper, SafeLoader = yaml_safe_codec()
+
+def _parse_port_range(value: str) -> Tuple[int, int]:
+    """
+    Parse a "start-end" port range.
+    
+    Raises:
+        ValueError: If the value is not exactly two integers
+    """
+    try:
+        start, end = map(int, value.split("-"))
+    except ValueError:
+        raise ValueError(f"Invalid port range {value!r}, expected START-END") from None
+    return start, end
+
+# Buffer size for settings file IO, so a settings file is read in one chunk
+_IO_BUFFER_SIZE = 1 << 16
+
+@dataclass(**DATACLASS_SLOTS)
 class AppSettings:
     """Application settings."""
     
@@ -26,16 +48,46 @@ class AppSettings:
     # Cache settings
     cache_ttl: int = 3600  # 1 hour in seconds
     
+    _dirs_ready: bool = field(default=False, init=False, repr=False, compare=False)
+    
+    # (key, coercer) pairs accepted from a settings file
+    _FIELD_COERCERS = (
+        ("base_dir", Path),
+        ("default_network", str),
+        ("default_port_range", lambda v: tuple(map(int, v))),
+        ("default_registry", str),
+        ("cache_ttl", int),
+    )
+    
+    # Environment variable -> (key, coercer) read by from_env
+    _ENV_MAP = {
+        "DOCKER_DEPLOYER_BASE_DIR": ("base_dir", Path),
+        "DOCKER_DEPLOYER_NETWORK": ("default_network", str),
+        "DOCKER_DEPLOYER_PORT_RANGE": ("default_port_range", _parse_port_range),
+        "DOCKER_DEPLOYER_REGISTRY": ("default_registry", str),
+        "DOCKER_DEPLOYER_CACHE_TTL": ("cache_ttl", int),
+    }
+    
     def __post_init__(self):
         """Initialize derived paths."""
+        self._derive_paths()
+    
+    def _derive_paths(self) -> None:
+        """Derive the directory paths from base_dir without creating them."""
         self.cache_dir = self.base_dir / "cache"
         self.log_dir = self.base_dir / "logs"
         self.default_volume_base = self.base_dir / "volumes"
+        self._dirs_ready = False
+    
+    def ensure_dirs(self) -> None:
+        """Create the settings directories if they don't exist."""
+        if self._dirs_ready:
+            return
         
-        # Create directories if they don't exist
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.log_dir.mkdir(parents=True, exist_ok=True)
         self.default_volume_base.mkdir(parents=True, exist_ok=True)
+        self._dirs_ready = True
     
     def to_dict(self) -> Dict[str, Union[str, int, List[int]]]:
         """Convert settings to dictionary."""
@@ -48,68 +100,52 @@ class AppSettings:
         }
     
     def save_to_file(self, path: Path) -> None:
-        """Save settings to YAML file."""
-        with open(path, 'w') as f:
-            yaml.dump(self.to_dict(), f, default_flow_style=False)
+        """Save settings to a JSON or YAML file, chosen by the file suffix."""
+        self.ensure_dirs()
+        with open(path, 'w', buffering=_IO_BUFFER_SIZE) as f:
+            if path.suffix == ".json":
+                json.dump(self.to_dict(), f, indent=2)
+            else:
+                yaml.dump(self.to_dict(), f, Dumper=SafeDumper, default_flow_style=False)
     
     def load_from_file(self, path: Path) -> None:
-        """Load settings from YAML file."""
+        """Load settings from a JSON or YAML file, chosen by the file suffix."""
         if not path.exists():
             return
         
-        with open(path) as f:
-            data = yaml.safe_load(f)
+        with open(path, buffering=_IO_BUFFER_SIZE) as f:
+            if path.suffix == ".json":
+                data = json.load(f)
+            else:
+                data = yaml.load(f, Loader=SafeLoader)
         
         # Update settings
+        for key, coerce in self._FIELD_COERCERS:
+            if key in data:
+                setattr(self, key, coerce(data[key]))
+        
         if "base_dir" in data:
-            self.base_dir = Path(data["base_dir"])
-            self.__post_init__()  # Reinitialize derived paths
-            
-        if "default_network" in data:
-            self.default_network = str(data["default_network"])
-            
-        if "default_port_range" in data:
-            self.default_port_range = tuple(map(int, data["default_port_range"]))
-            
-        if "default_registry" in data:
-            self.default_registry = str(data["default_registry"])
-            
-        if "cache_ttl" in data:
-            self.cache_ttl = int(data["cache_ttl"])
+            self._derive_paths()
     
     @classmethod
     def from_env(cls) -> "AppSettings":
         """Create settings from environment variables."""
         settings = cls()
         
-        # Base directory
-        if base_dir := os.getenv("DOCKER_DEPLOYER_BASE_DIR"):
-            settings.base_dir = Path(base_dir)
-            settings.__post_init__()
-        
-        # Docker settings
-        if network := os.getenv("DOCKER_DEPLOYER_NETWORK"):
-            settings.default_network = network
-            
-        if port_range := os.getenv("DOCKER_DEPLOYER_PORT_RANGE"):
-            start, end = map(int, port_range.split("-"))
-            settings.default_port_range = (start, end)
-            
-        if registry := os.getenv("DOCKER_DEPLOYER_REGISTRY"):
-            settings.default_registry = registry
+        base_dir_changed = False
+        for env_var, value in os.environ.items():
+            spec = cls._ENV_MAP.get(env_var)
+            if spec and value:
+                key, coerce = spec
+                setattr(settings, key, coerce(value))
+                base_dir_changed |= key == "base_dir"
         
-        # Cache settings
-        if cache_ttl := os.getenv("DOCKER_DEPLOYER_CACHE_TTL"):
-            settings.cache_ttl = int(cache_ttl)
+        if base_dir_changed:
+            settings._derive_paths()
         
         return settings
 
-# Global settings instance
-_settings: Optional[AppSettings] = None
-
+@functools.lru_cache(maxsize=1)
 def get_config() -> AppSettings:
     """Get the global settings instance."""
-    global _settings
-    if _settings is None:
-        _settings = AppSettings.from_env()
-    return _settings 
\ No newline at end of file
+    return AppSettings.from_env()
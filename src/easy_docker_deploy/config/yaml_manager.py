@@ -1,18 +1,86 @@
 """
 Module for managing unified YAML configuration files.
 """
+import copy
+import hashlib
 import os
+import re
 import subprocess
 from pathlib import Path
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, List, Optional, Tuple
 import yaml
 
+from ..docker.manager import DockerManager
+from ..utils.compat import yaml_safe_codec
 from ..utils.logging import get_logger
 from ..utils.exceptions import ConfigurationError
 from ..config.settings import get_config
 
 logger = get_logger(__name__)
 
+SafeDumper, SafeLoader = yaml_safe_codec()
+
+def _yaml_load(stream) -> Any:
+    """Parse a YAML document with the fastest available safe loader."""
+    return yaml.load(stream, Loader=SafeLoader)
+
+def _yaml_dump(data: Any) -> bytes:
+    """Serialize a document to UTF-8 encoded YAML."""
+    return yaml.dump(
+        data,
+        Dumper=SafeDumper,
+        encoding="utf-8",
+        default_flow_style=False,
+        sort_keys=False,
+        width=120,
+        allow_unicode=True
+    )
+
+# Short-syntax port mapping: [IP:][HOST[-END]:]CONTAINER[-END][/PROTOCOL]
+_PORT_RE = re.compile(
+    r"^(?:(?:[\d.]+|\[[0-9a-fA-F:]+\]):)?"
+    r"(?:(?:\d+(?:-\d+)?)?:)?"
+    r"\d+(?:-\d+)?(?:/(?:tcp|udp|sctp))?$"
+)
+
+def _find_config_errors(config: Dict[str, Any]) -> List[str]:
+    """
+    Find obvious mistakes that docker compose would reject anyway.
+    
+    Only clear-cut problems are reported; docker compose stays the
+    authoritative validator for everything else.
+    
+    Args:
+        config: Configuration to check
+        
+    Returns:
+        List of error messages, empty if nothing obvious is wrong
+    """
+    services = config.get("services") or {}
+    if not isinstance(services, dict):
+        return ["services must be a mapping"]
+    
+    errors = []
+    for name, service in services.items():
+        if not isinstance(service, dict):
+            errors.append(f"Service {name} must be a mapping")
+            continue
+        # Services using extends inherit image/build from their base
+        if not {"image", "build", "extends"} & service.keys():
+            errors.append(f"Service {name} has no image or build")
+        for port in service.get("ports") or []:
+            port = str(port) if isinstance(port, int) else port
+            # Long-syntax mappings and ${VAR} interpolation are left to compose
+            if isinstance(port, str) and "$" not in port and not _PORT_RE.match(port):
+                errors.append(f"Service {name} has invalid port mapping: {port}")
+    return errors
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    """Write a file through a temporary sibling so readers never see a partial file."""
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
 class YAMLManager:
     """Manager for unified YAML configuration files."""
     
@@ -27,6 +95,28 @@ class YAMLManager:
         self.compose_file = base_dir / "docker-compose.yml"
         self.comments_file = base_dir / "docker-compose.comments.yml"
         self.config = get_config()
+        self._cache: Dict[Path, Tuple[int, Any]] = {}
+        
+        # Digest of the last configuration that passed validation. Kept in
+        # memory only: the result also depends on the environment the file
+        # interpolates and on the compose version, which can change between runs
+        self._validated_digest: Optional[str] = None
+    
+    def _load_cached(self, path: Path) -> Any:
+        """
+        Load a YAML file, reusing the last parse while the file is unchanged.
+        
+        Args:
+            path: File to load
+            
+        Returns:
+            A copy of the parsed document, safe for the caller to modify
+        """
+        mtime = path.stat().st_mtime_ns
+        cached = self._cache.get(path)
+        if cached is None or cached[0] != mtime:
+            cached = self._cache[path] = (mtime, _yaml_load(path.read_bytes()) or {})
+        return copy.deepcopy(cached[1])
         
     def load_config(self) -> Dict[str, Any]:
         """
@@ -47,8 +137,7 @@ class YAMLManager:
                     "volumes": {}
                 }
             
-            with open(self.compose_file) as f:
-                return yaml.safe_load(f) or {}
+            return self._load_cached(self.compose_file)
                 
         except Exception as e:
             logger.error(f"Failed to load configuration: {str(e)}")
@@ -72,47 +161,38 @@ class YAMLManager:
                     "global": "Docker Compose configuration for Self-Hosted Docker Deployer"
                 }
             
-            with open(self.comments_file) as f:
-                return yaml.safe_load(f) or {}
+            return self._load_cached(self.comments_file)
                 
         except Exception as e:
             logger.error(f"Failed to load comments: {str(e)}")
             return {}  # Return empty comments if loading fails
     
-    def save_config(self, config: Dict[str, Any], comments: Optional[Dict[str, Any]] = None) -> None:
+    def save_config(
+        self,
+        config: Dict[str, Any],
+        comments: Optional[Dict[str, Any]] = None,
+        dumped: Optional[bytes] = None
+    ) -> None:
         """
         Save configuration to YAML file.
         
         Args:
             config: Configuration dictionary to save
             comments: Optional comments dictionary to save
+            dumped: Optional already serialized form of config, reused as is
         """
         try:
             # Create directory if it doesn't exist
             os.makedirs(self.base_dir, exist_ok=True)
             
+            self._cache.clear()
+            
             # Save configuration
-            with open(self.compose_file, 'w') as f:
-                yaml.dump(
-                    config,
-                    f,
-                    default_flow_style=False,
-                    sort_keys=False,
-                    width=120,
-                    allow_unicode=True
-                )
+            _atomic_write(self.compose_file, dumped or _yaml_dump(config))
             
             # Save comments if provided
             if comments:
-                with open(self.comments_file, 'w') as f:
-                    yaml.dump(
-                        comments,
-                        f,
-                        default_flow_style=False,
-                        sort_keys=False,
-                        width=120,
-                        allow_unicode=True
-                    )
+                _atomic_write(self.comments_file, _yaml_dump(comments))
                 
             logger.debug(f"Configuration saved to {self.compose_file}")
             
@@ -120,13 +200,18 @@ class YAMLManager:
             logger.error(f"Failed to save configuration: {str(e)}")
             raise ConfigurationError(f"Failed to save configuration: {str(e)}")
     
-    def validate_config(self, config: Optional[Dict[str, Any]] = None) -> bool:
+    def validate_config(
+        self,
+        config: Optional[Dict[str, Any]] = None,
+        dumped: Optional[bytes] = None
+    ) -> bool:
         """
         Validate Docker Compose configuration.
         
         Args:
             config: Optional configuration to validate. If not provided,
                    the current configuration file will be validated.
+            dumped: Optional already serialized form of config, reused as is
                    
         Returns:
             True if configuration is valid
@@ -136,30 +221,47 @@ class YAMLManager:
         """
         try:
             if config is not None:
-                # Save temporary file for validation
-                temp_file = self.base_dir / "docker-compose.validate.yml"
-                with open(temp_file, 'w') as f:
-                    yaml.dump(config, f, default_flow_style=False)
-                file_to_validate = temp_file
+                # Catch obvious mistakes without starting docker compose
+                errors = _find_config_errors(config)
+                if errors:
+                    raise ConfigurationError(
+                        f"Invalid Docker Compose configuration: {'; '.join(errors)}"
+                    )
+                
+                # Pipe the configuration through stdin instead of a temp file
+                compose_input = dumped or _yaml_dump(config)
+                file_to_validate = "-"
+                
+                # Skip docker compose if this exact configuration already passed
+                digest = hashlib.sha256(compose_input).hexdigest()
+                if self._validated_digest == digest:
+                    logger.debug("Configuration unchanged since last validation")
+                    return True
             else:
-                file_to_validate = self.compose_file
+                compose_input = None
+                file_to_validate = str(self.compose_file)
             
-            # Validate using docker-compose config
+            # Validate using docker compose config
             result = subprocess.run(
-                ["docker-compose", "-f", str(file_to_validate), "config", "--quiet"],
-                capture_output=True,
-                text=True
+                [
+                    *DockerManager.COMPOSE_CMD,
+                    "--project-directory", str(self.base_dir),
+                    "-f", file_to_validate,
+                    "config", "--quiet"
+                ],
+                input=compose_input,
+                capture_output=True
             )
             
-            if config is not None:
-                # Clean up temporary file
-                temp_file.unlink()
-            
             if result.returncode != 0:
+                stderr = result.stderr.decode("utf-8", errors="replace")
                 raise ConfigurationError(
-                    f"Invalid Docker Compose configuration: {result.stderr}"
+                    f"Invalid Docker Compose configuration: {stderr}"
                 )
             
+            if config is not None:
+                self._validated_digest = digest
+            
             return True
             
         except Exception as e:
@@ -180,56 +282,67 @@ class YAMLManager:
         """
         try:
             # Load existing configuration and comments
-            current_config = self.load_config()
-            current_comments = self.load_comments()
-            
-            # Extract comments from new config
-            new_comments = {}
-            clean_config = {}
-            
-            for key, value in new_config.items():
-                if key == "_comments":
-                    new_comments.update(value)
-                else:
-                    if isinstance(value, dict):
-                        service_comments = value.pop("_comments", {})
-                        if service_comments:
-                            new_comments[key] = service_comments
-                    clean_config[key] = value
-            
-            # Merge services
-            if "services" in clean_config:
-                if "services" not in current_config:
-                    current_config["services"] = {}
-                current_config["services"].update(clean_config["services"])
-            
-            # Merge networks
-            if "networks" in clean_config:
-                if "networks" not in current_config:
-                    current_config["networks"] = {}
-                current_config["networks"].update(clean_config["networks"])
-            
-            # Merge volumes
-            if "volumes" in clean_config:
-                if "volumes" not in current_config:
-                    current_config["volumes"] = {}
-                current_config["volumes"].update(clean_config["volumes"])
-            
-            # Merge comments
-            for key, value in new_comments.items():
-                if key not in current_comments:
-                    current_comments[key] = {}
-                if isinstance(value, dict):
-                    current_comments[key].update(value)
-                else:
-                    current_comments[key] = value
-            
-            return current_config, current_comments
+            return self.unsafe_merge_config(
+                self.load_config(),
+                self.load_comments(),
+                new_config
+            )
             
         except Exception as e:
             logger.error(f"Failed to merge configurations: {str(e)}")
             raise ConfigurationError(f"Failed to merge configurations: {str(e)}")
     
+    @staticmethod
+    def unsafe_merge_config(
+        current_config: Dict[str, Any],
+        current_comments: Dict[str, Any],
+        new_config: Dict[str, Any]
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Merge new configuration into already loaded configuration and comments.
+        
+        The current dictionaries are updated in place and nothing is reloaded
+        from disk. new_config is left untouched.
+        
+        Args:
+            current_config: Loaded configuration to merge into
+            current_comments: Loaded comments to merge into
+            new_config: New configuration to merge
+            
+        Returns:
+            Tuple of (merged configuration dictionary, merged comments dictionary)
+        """
+        # Extract comments from new config
+        new_comments = {}
+        clean_config = {}
+        
+        for key, value in new_config.items():
+            if key == "_comments":
+                new_comments.update(value)
+            elif isinstance(value, dict) and "_comments" in value:
+                if value["_comments"]:
+                    new_comments[key] = value["_comments"]
+                clean_config[key] = {k: v for k, v in value.items() if k != "_comments"}
+            else:
+                clean_config[key] = value
+        
+        # Merge services, networks and volumes
+        for section in ("services", "networks", "volumes"):
+            if section in clean_config:
+                current_config[section] = {
+                    **(current_config.get(section) or {}),
+                    **clean_config[section]
+                }
+        
+        # Merge comments
+        for key, value in new_comments.items():
+            if isinstance(value, dict):
+                current_comments.setdefault(key, {}).update(value)
+            else:
+                current_comments[key] = value
+        
+        return current_config, current_comments
+    
     def update_config(self, new_config: Dict[str, Any], validate: bool = True) -> None:
         """
         Update configuration with new settings.
@@ -240,7 +353,11 @@ class YAMLManager:
         """
         try:
             # Merge configurations and comments
-            merged_config, merged_comments = self.merge_config(new_config)
+            merged_config, merged_comments = self.unsafe_merge_config(
+                self.load_config(),
+                self.load_comments(),
+                new_config
+            )
             
             # Ensure network configuration is present
             if "networks" not in merged_config:
@@ -257,12 +374,15 @@ class YAMLManager:
                 elif self.config.default_network not in service["networks"]:
                     service["networks"].append(self.config.default_network)
             
+            # Serialize once for both validation and saving
+            dumped = _yaml_dump(merged_config)
+            
             # Validate if requested
             if validate:
-                self.validate_config(merged_config)
+                self.validate_config(merged_config, dumped)
             
             # Save merged configuration and comments
-            self.save_config(merged_config, merged_comments)
+            self.save_config(merged_config, merged_comments, dumped)
             
             logger.info("Configuration updated successfully")
             
@@ -285,12 +405,12 @@ class YAMLManager:
             comments = self.load_comments()
             
             # Remove services
-            for name in service_names:
-                if name in config.get("services", {}):
-                    del config["services"][name]
-                    if "services" in comments and name in comments["services"]:
-                        del comments["services"][name]
-                    logger.debug(f"Removed service: {name}")
+            services = config.get("services") or {}
+            service_comments = comments.get("services") or {}
+            for name in set(service_names) & services.keys():
+                del services[name]
+                service_comments.pop(name, None)
+                logger.debug(f"Removed service: {name}")
             
             # Save updated configuration and comments
             self.save_config(config, comments)
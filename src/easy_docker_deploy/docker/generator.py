@@ -1,13 +1,24 @@
 """
 Docker compose generator for creating docker-compose files.
 """
+import json
+import re
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, List, Optional
-import jinja2
-import yaml
 
-@dataclass
+from ..utils.compat import DATACLASS_SLOTS
+
+# Characters a YAML stream may not hold literally (or folds as line breaks);
+# everything else, including non-BMP characters, is written as-is
+_YAML_ESCAPE_RE = re.compile('[\x7f-\x9f\u2028\u2029\ud800-\udfff\ufeff\ufffe\uffff]')
+
+def _quote(value) -> str:
+    """Quote a scalar as a JSON string, which is also a valid YAML scalar."""
+    quoted = json.dumps(str(value), ensure_ascii=False)
+    return _YAML_ESCAPE_RE.sub(lambda match: f"\\u{ord(match.group()):04x}", quoted)
+
+@dataclass(**DATACLASS_SLOTS)
 class DockerConfig:
     """Docker container configuration."""
     image: str
@@ -19,48 +30,42 @@ class DockerConfig:
 class DockerComposeGenerator:
     """Generates docker-compose.yml files."""
     
-    def __init__(self, template_dir: Optional[Path] = None):
-        self.template_dir = template_dir or Path(__file__).parent / "templates"
-        self.env = jinja2.Environment(
-            loader=jinja2.FileSystemLoader(str(self.template_dir)),
-            autoescape=True,
-            trim_blocks=True,
-            lstrip_blocks=True,
-        )
-    
     def generate_compose_file(self, service_name: str, config: DockerConfig) -> str:
-        """Generate docker-compose.yml content."""
-        compose_config = {
-            'version': '3.8',
-            'services': {
-                service_name: {
-                    'image': config.image,
-                    'container_name': config.container_name or service_name,
-                    'restart': 'unless-stopped',
-                }
-            }
-        }
+        """
+        Generate docker-compose.yml content.
         
-        service = compose_config['services'][service_name]
+        The output always has the same shape, so it is assembled directly
+        instead of going through the generic YAML emitter.
+        """
+        lines = [
+            'version: "3.8"',
+            'services:',
+            f'  {_quote(service_name)}:',
+            f'    image: {_quote(config.image)}',
+            f'    container_name: {_quote(config.container_name or service_name)}',
+            '    restart: "unless-stopped"',
+        ]
         
-        # Add port mappings if any
-        if config.ports:
-            service['ports'] = config.ports
-            
-        # Add volume mappings if any
-        if config.volumes:
-            service['volumes'] = config.volumes
+        # Add port and volume mappings if any
+        for key, items in (("ports", config.ports), ("volumes", config.volumes)):
+            if items:
+                lines.append(f"    {key}:")
+                lines.extend(f"      - {_quote(item)}" for item in items)
             
         # Add environment variables if any
         if config.environment:
-            service['environment'] = config.environment
+            lines.append("    environment:")
+            lines.extend(
+                f"      {_quote(name)}: {_quote(value)}"
+                for name, value in config.environment.items()
+            )
             
-        return yaml.dump(compose_config, sort_keys=False, default_flow_style=False)
+        return "\n".join(lines) + "\n"
     
     def save_compose_file(self, output_path: Path, content: str) -> None:
         """Save docker-compose.yml file."""
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_text(content)
+        output_path.write_text(content, encoding="utf-8")
     
     def validate_config(self, config: DockerConfig) -> List[str]:
         """Validate the Docker configuration."""
@@ -0,0 +1,91 @@
+"""
+Interactive prompts for building Docker deployment settings.
+"""
+import functools
+import re
+from typing import Optional, Tuple
+
+# Maps Windows path separators to POSIX ones
+_PATH_TRANS = str.maketrans('\\', '/')
+
+# Valid environment variable names
+_ENV_NAME_RE = re.compile(r'^[a-zA-Z_][a-zA-Z0-9_]*$')
+
+@functools.lru_cache(maxsize=256)
+def _validate_port(port: str) -> Optional[int]:
+    """Validate a port number."""
+    port = port.strip()
+    if port.isascii() and port.isdigit() and 1 <= (port_num := int(port)) <= 65535:
+        return port_num
+    return None
+
+def _normalize_path(path: str) -> str:
+    """Normalize a file system path."""
+    # Convert Windows separators and remove any trailing slashes
+    return path.translate(_PATH_TRANS).rstrip('/')
+
+def get_port_mapping(prompt: str = "Enter port") -> Optional[Tuple[int, int]]:
+    """
+    Get a validated port mapping from user input.
+    
+    Args:
+        prompt: Custom prompt for the port input
+    
+    Returns:
+        Optional[Tuple[int, int]]: Tuple of (container_port, host_port) or None if invalid
+    """
+    container_port = input(f"{prompt} (container): ")
+    if not container_port:
+        return None
+    
+    container_port_num = _validate_port(container_port)
+    if not container_port_num:
+        print("Invalid port number. Please enter a number between 1 and 65535.")
+        return None
+    
+    host_port = input(f"Enter host port for {container_port_num}: ")
+    host_port_num = _validate_port(host_port)
+    if not host_port_num:
+        print("Invalid port number. Please enter a number between 1 and 65535.")
+        return None
+    
+    return (container_port_num, host_port_num)
+
+def get_volume_mapping() -> Optional[Tuple[str, str]]:
+    """
+    Get a validated volume mapping from user input.
+    
+    Returns:
+        Optional[Tuple[str, str]]: Tuple of (container_path, host_path) or None if invalid
+    """
+    container_path = input("Enter container path: ")
+    if not container_path:
+        return None
+    
+    container_path = _normalize_path(container_path)
+    
+    host_path = input(f"Enter host path: ")
+    if not host_path:
+        return None
+    
+    host_path = _normalize_path(host_path)
+    
+    return (container_path, host_path)
+
+def get_env_variable() -> Optional[Tuple[str, str]]:
+    """
+    Get an environment variable from user input.
+    
+    Returns:
+        Optional[Tuple[str, str]]: Tuple of (name, value) or None if invalid
+    """
+    name = input("Enter variable name: ")
+    if not name or not _ENV_NAME_RE.match(name):
+        print("Invalid variable name. Use letters, numbers, and underscores only.")
+        return None
+    
+    value = input(f"Enter value for {name}: ")
+    if not value:
+        return None
+    
+    return (name, value)
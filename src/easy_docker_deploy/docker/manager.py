@@ -1,16 +1,26 @@
 """
 Docker operations manager.
 """
+import functools
 import json
 import os
+import re
 import subprocess
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
 from ..utils.logging import get_logger, log_with_context
 
 logger = get_logger(__name__)
 
+# Set once docker and docker compose have been verified in this process
+_docker_verified = False
+_verify_lock = threading.Lock()
+
 class DockerError(Exception):
     """Base class for Docker-related errors."""
     pass
@@ -23,12 +33,98 @@ class NetworkError(DockerError):
     """Raised when there's an error with Docker networks."""
     pass
 
+def _compose_project_name(deploy_dir: Path) -> str:
+    """Get the default docker-compose project name for a directory."""
+    return re.sub(r"[^a-z0-9_-]", "", deploy_dir.name.lower()).lstrip("_-")
+
+def pull_concurrently(
+    pull: Callable[[str], Any],
+    images: Iterable[str],
+    max_workers: int = 8,
+    on_pulled: Optional[Callable[[str, Optional[Exception]], None]] = None
+) -> Dict[str, Exception]:
+    """
+    Pull images side by side on a thread pool.
+    
+    Args:
+        pull: Function that pulls a single image
+        images: Images to pull; duplicates are pulled once
+        max_workers: Maximum number of simultaneous pulls
+        on_pulled: Called in the calling thread with each image and its
+            error (None on success) as soon as that pull finishes
+        
+    Returns:
+        Errors of the failed pulls, by image
+    """
+    images = list(dict.fromkeys(images))
+    if not images:
+        return {}
+    
+    errors = {}
+    
+    # Pulls are independent network-bound operations, so run them side by side
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(images))) as executor:
+        futures = {executor.submit(pull, image): image for image in images}
+        for future in as_completed(futures):
+            image = futures[future]
+            error = future.exception()
+            if error is not None:
+                errors[image] = error
+            if on_pulled is not None:
+                on_pulled(image, error)
+    
+    return errors
+
 class DockerManager:
     """Manager for Docker operations."""
     
+    # Docker Compose v2 plugin; avoids the slower standalone docker-compose
+    COMPOSE_CMD = ("docker", "compose")
+    
+    # Seconds to reuse a container status before querying Docker again
+    STATUS_CACHE_TTL = 3.0
+    
+    # Seconds to reuse a registry digest before asking the registry again
+    REGISTRY_DIGEST_TTL = 60.0
+    
     def __init__(self):
-        self._verify_docker_installed()
-        self._verify_compose_installed()
+        self._status_cache: Dict[Path, Tuple[float, Dict[str, str]]] = {}
+        self._registry_digests: Dict[str, Tuple[float, Optional[str]]] = {}
+        self._ensure_verified()
+    
+    def clear_status_cache(self, deploy_dir: Optional[Path] = None) -> None:
+        """
+        Drop cached container statuses.
+        
+        Args:
+            deploy_dir: Only drop the entry for this directory if given
+        """
+        if deploy_dir is None:
+            self._status_cache.clear()
+        else:
+            self._status_cache.pop(deploy_dir, None)
+    
+    @functools.cached_property
+    def _client(self):
+        """Docker SDK client, shared so API calls reuse one daemon connection."""
+        import docker
+        
+        try:
+            return docker.from_env()
+        except docker.errors.DockerException as e:
+            raise DockerError(f"Failed to connect to Docker: {str(e)}") from e
+    
+    def _ensure_verified(self) -> None:
+        """Verify Docker and Docker Compose once per process."""
+        global _docker_verified
+        if _docker_verified:
+            return
+        
+        with _verify_lock:
+            if not _docker_verified:
+                self._verify_docker_installed()
+                self._verify_compose_installed()
+                _docker_verified = True
     
     def _verify_docker_installed(self) -> None:
         """Verify that Docker is installed and running."""
@@ -51,7 +147,7 @@ class DockerManager:
         """Verify that Docker Compose is installed."""
         try:
             result = subprocess.run(
-                ["docker", "compose", "version"],
+                [*self.COMPOSE_CMD, "version"],
                 capture_output=True,
                 text=True,
                 check=True
@@ -74,6 +170,7 @@ class DockerManager:
         Raises:
             CommandError: If the command fails
         """
+        self.clear_status_cache(deploy_dir)
         try:
             logger.info(
                 "Starting container",
@@ -81,7 +178,7 @@ class DockerManager:
             )
             
             result = subprocess.run(
-                ["docker", "compose", "up", "-d"],
+                [*self.COMPOSE_CMD, "up", "-d"],
                 cwd=deploy_dir,
                 capture_output=True,
                 text=True,
@@ -114,6 +211,7 @@ class DockerManager:
         Raises:
             CommandError: If the command fails
         """
+        self.clear_status_cache(deploy_dir)
         try:
             logger.info(
                 "Stopping container",
@@ -121,7 +219,7 @@ class DockerManager:
             )
             
             result = subprocess.run(
-                ["docker", "compose", "down"],
+                [*self.COMPOSE_CMD, "down"],
                 cwd=deploy_dir,
                 capture_output=True,
                 text=True,
@@ -144,54 +242,137 @@ class DockerManager:
             )
             raise CommandError(f"Failed to stop container: {e.output}") from e
     
-    def get_container_status(self, deploy_dir: Path) -> Dict[str, str]:
+    def describe_project(self, deploy_dir: Path) -> Dict[str, Dict[str, Any]]:
         """
-        Get status of containers in a docker-compose project.
+        Describe every container in a docker-compose project.
+        
+        Uses a single container listing filtered by the compose project label,
+        so status, image, networks and creation time come back in one request.
         
         Args:
             deploy_dir: Directory containing docker-compose.yml
             
         Returns:
-            Dictionary mapping container names to their status
+            Dictionary mapping container names to their service, status,
+            image, networks and creation timestamp
             
         Raises:
             CommandError: If the command fails
         """
+        import docker
+        
         try:
-            result = subprocess.run(
-                ["docker", "compose", "ps", "--format", "json"],
-                cwd=deploy_dir,
-                capture_output=True,
-                text=True,
-                check=True
+            containers = self._client.containers.list(
+                all=True,
+                sparse=True,
+                filters={"label": f"com.docker.compose.project={_compose_project_name(deploy_dir)}"}
             )
-            
-            # Parse JSON output
-            containers = json.loads(result.stdout)
-            return {
-                container["Name"]: container["State"]
-                for container in containers
-            }
-            
-        except subprocess.CalledProcessError as e:
+        except docker.errors.DockerException as e:
             logger.error(
-                "Failed to get container status",
+                "Failed to describe project",
                 **log_with_context(
                     directory=str(deploy_dir),
-                    error=str(e),
-                    output=e.output
+                    error=str(e)
                 )
             )
-            raise CommandError(f"Failed to get container status: {e.output}") from e
-        except json.JSONDecodeError as e:
-            logger.error(
-                "Failed to parse container status",
-                **log_with_context(
-                    directory=str(deploy_dir),
-                    error=str(e)
+            raise CommandError(f"Failed to describe project: {str(e)}") from e
+        
+        project = {}
+        for container in containers:
+            attrs = container.attrs
+            project[attrs["Names"][0].lstrip("/")] = {
+                "service": (attrs.get("Labels") or {}).get("com.docker.compose.service"),
+                "status": attrs["State"],
+                "image": attrs["Image"],
+                "networks": list((attrs.get("NetworkSettings") or {}).get("Networks") or {}),
+                "created": attrs["Created"]
+            }
+        return project
+    
+    def get_container_status(self, deploy_dir: Path) -> Dict[str, str]:
+        """
+        Get status of containers in a docker-compose project.
+        
+        Args:
+            deploy_dir: Directory containing docker-compose.yml
+            
+        Returns:
+            Dictionary mapping container names to their status
+            
+        Raises:
+            CommandError: If the command fails
+        """
+        cached = self._status_cache.get(deploy_dir)
+        if cached and time.monotonic() - cached[0] < self.STATUS_CACHE_TTL:
+            return cached[1]
+        
+        status = {
+            name: container["status"]
+            for name, container in self.describe_project(deploy_dir).items()
+        }
+        self._status_cache[deploy_dir] = (time.monotonic(), status)
+        return status
+    
+    def get_all_container_statuses(
+        self,
+        deploy_dirs: Dict[str, Path]
+    ) -> Dict[str, Dict[str, str]]:
+        """
+        Get status of containers for several docker-compose projects at once.
+        
+        Issues a single ``docker ps`` call and groups the containers by their
+        compose project label instead of querying each project separately.
+        
+        Args:
+            deploy_dirs: Mapping of deployment names to their directories
+            
+        Returns:
+            Dictionary mapping deployment names to container name/status maps
+            
+        Raises:
+            CommandError: If the command fails
+        """
+        # stderr goes to a file rather than a pipe, so a chatty stderr cannot
+        # fill up and block docker while stdout is being read
+        with tempfile.TemporaryFile(mode="w+") as stderr:
+            try:
+                process = subprocess.Popen(
+                    [
+                        "docker", "ps", "--all",
+                        "--filter", "label=com.docker.compose.project",
+                        "--format", '{{.Label "com.docker.compose.project"}}\t{{.Names}}\t{{.State}}'
+                    ],
+                    stdout=subprocess.PIPE,
+                    stderr=stderr,
+                    text=True
                 )
+            except OSError as e:
+                raise CommandError(f"Failed to get container statuses: {str(e)}") from e
+            
+            # Group containers by compose project, one tab-separated row per line
+            projects: Dict[str, Dict[str, str]] = {}
+            with process:
+                for line in process.stdout:
+                    project, _, rest = line.rstrip("\n").partition("\t")
+                    name, _, state = rest.partition("\t")
+                    if project and name:
+                        projects.setdefault(project, {})[name] = state
+                returncode = process.wait()
+            
+            stderr.seek(0)
+            error = stderr.read()
+        
+        if returncode != 0:
+            logger.error(
+                "Failed to get container statuses",
+                **log_with_context(output=error)
             )
-            raise CommandError(f"Failed to parse container status: {str(e)}") from e
+            raise CommandError(f"Failed to get container statuses: {error}")
+        
+        return {
+            name: projects.get(_compose_project_name(deploy_dir), {})
+            for name, deploy_dir in deploy_dirs.items()
+        }
     
     def get_container_logs(self, deploy_dir: Path, tail: Optional[int] = None) -> str:
         """
@@ -208,7 +389,7 @@ class DockerManager:
             CommandError: If the command fails
         """
         try:
-            cmd = ["docker", "compose", "logs"]
+            cmd = [*self.COMPOSE_CMD, "logs"]
             if tail is not None:
                 cmd.extend(["--tail", str(tail)])
             
@@ -233,6 +414,64 @@ class DockerManager:
             )
             raise CommandError(f"Failed to get container logs: {e.output}") from e
     
+    def stream_container_logs(
+        self,
+        deploy_dir: Path,
+        tail: Optional[int] = None
+    ) -> Iterator[bytes]:
+        """
+        Follow logs from containers in a docker-compose project.
+        
+        Lines are yielded as raw bytes as soon as docker-compose emits them.
+        The underlying process is terminated when the iterator is closed or
+        interrupted.
+        
+        Args:
+            deploy_dir: Directory containing docker-compose.yml
+            tail: Number of lines to tail from the end before following
+            
+        Yields:
+            Log lines as bytes, including the trailing newline
+            
+        Raises:
+            CommandError: If the command fails
+        """
+        cmd = [*self.COMPOSE_CMD, "logs", "--follow"]
+        if tail is not None:
+            cmd.extend(["--tail", str(tail)])
+        
+        # stderr goes to a file rather than a pipe: it is only read once the
+        # logs end, and a full stderr pipe would block docker meanwhile
+        with tempfile.TemporaryFile() as stderr:
+            try:
+                process = subprocess.Popen(
+                    cmd,
+                    cwd=deploy_dir,
+                    stdout=subprocess.PIPE,
+                    stderr=stderr
+                )
+            except OSError as e:
+                raise CommandError(f"Failed to follow container logs: {str(e)}") from e
+            
+            try:
+                yield from process.stdout
+                if process.wait() != 0:
+                    stderr.seek(0)
+                    error = stderr.read().decode(errors="replace")
+                    logger.error(
+                        "Failed to follow container logs",
+                        **log_with_context(
+                            directory=str(deploy_dir),
+                            output=error
+                        )
+                    )
+                    raise CommandError(f"Failed to follow container logs: {error}")
+            finally:
+                if process.poll() is None:
+                    process.terminate()
+                    process.wait()
+                process.stdout.close()
+    
     def ensure_network_exists(self, network: str) -> None:
         """
         Ensure a Docker network exists, creating it if necessary.
@@ -243,46 +482,39 @@ class DockerManager:
         Raises:
             NetworkError: If network creation fails
         """
+        import docker
+        
+        try:
+            self._client.networks.get(network)
+            logger.debug(f"Network {network} already exists")
+            return
+        except docker.errors.NotFound:
+            pass
+        except docker.errors.DockerException as e:
+            raise NetworkError(f"Failed to inspect network {network}: {str(e)}") from e
+        
         try:
-            # Check if network exists
-            result = subprocess.run(
-                ["docker", "network", "inspect", network],
-                capture_output=True,
-                text=True
-            )
-            
-            if result.returncode == 0:
-                logger.debug(f"Network {network} already exists")
-                return
-            
-            # Create network if it doesn't exist
             logger.info(
                 "Creating network",
                 **log_with_context(network=network)
             )
             
-            result = subprocess.run(
-                ["docker", "network", "create", network],
-                capture_output=True,
-                text=True,
-                check=True
-            )
+            self._client.networks.create(network)
             
             logger.info(
                 "Network created successfully",
                 **log_with_context(network=network)
             )
             
-        except subprocess.CalledProcessError as e:
+        except docker.errors.DockerException as e:
             logger.error(
                 "Failed to create network",
                 **log_with_context(
                     network=network,
-                    error=str(e),
-                    output=e.output
+                    error=str(e)
                 )
             )
-            raise NetworkError(f"Failed to create network {network}: {e.output}") from e
+            raise NetworkError(f"Failed to create network {network}: {str(e)}") from e
     
     def pull_image(self, image: str) -> None:
         """
@@ -294,41 +526,130 @@ class DockerManager:
         Raises:
             CommandError: If the pull fails
         """
+        import docker
+        
         try:
             logger.info(
                 "Pulling image",
                 **log_with_context(image=image)
             )
             
-            result = subprocess.run(
-                ["docker", "pull", image],
-                capture_output=True,
-                text=True,
-                check=True
-            )
+            self._client.images.pull(image)
             
             logger.info(
                 "Image pulled successfully",
                 **log_with_context(image=image)
             )
             
-        except subprocess.CalledProcessError as e:
+        except docker.errors.DockerException as e:
             logger.error(
                 "Failed to pull image",
                 **log_with_context(
                     image=image,
-                    error=str(e),
-                    output=e.output
+                    error=str(e)
                 )
             )
-            raise CommandError(f"Failed to pull image {image}: {e.output}") from e
-
-# Global manager instance
-_manager: Optional[DockerManager] = None
+            raise CommandError(f"Failed to pull image {image}: {str(e)}") from e
+    
+    def pull_images(
+        self,
+        images: List[str],
+        max_workers: int = 8,
+        on_pulled: Optional[Callable[[str, Optional[Exception]], None]] = None
+    ) -> None:
+        """
+        Pull several Docker images concurrently.
+        
+        Args:
+            images: Images to pull
+            max_workers: Maximum number of simultaneous pulls
+            on_pulled: Called with each image and its error (None on success)
+                as soon as that pull finishes, e.g. to report progress
+            
+        Raises:
+            CommandError: If any pull fails, listing every failed image
+        """
+        # Create the shared client here; the workers would otherwise race
+        # to build it, and cached_property does not lock on 3.12+
+        self._client
+        
+        errors = pull_concurrently(self.pull_image, images, max_workers, on_pulled)
+        if errors:
+            raise CommandError("; ".join(str(error) for error in errors.values()))
+    
+    def pull_if_stale(self, image: str) -> bool:
+        """
+        Pull a Docker image only if the registry has a different digest.
+        
+        Args:
+            image: Image to pull (e.g. 'nginx:latest')
+            
+        Returns:
+            True if the image was pulled, False if the local copy is current
+            
+        Raises:
+            CommandError: If the pull fails
+        """
+        local_digests = self._get_local_digests(image)
+        if local_digests:
+            remote_digest = self._get_registry_digest(image)
+            if remote_digest and remote_digest in local_digests:
+                logger.debug(
+                    "Image is up to date, skipping pull",
+                    **log_with_context(image=image, digest=remote_digest)
+                )
+                return False
+        
+        self.pull_image(image)
+        self._registry_digests.pop(image, None)
+        return True
+    
+    def _get_local_digests(self, image: str) -> List[str]:
+        """Get the repository digests of a locally available image."""
+        result = subprocess.run(
+            ["docker", "image", "inspect", "--format", "{{json .RepoDigests}}", image],
+            capture_output=True,
+            text=True
+        )
+        if result.returncode != 0:
+            return []
+        
+        try:
+            repo_digests = json.loads(result.stdout) or []
+        except json.JSONDecodeError:
+            return []
+        return [digest.partition("@")[2] for digest in repo_digests]
+    
+    def _get_registry_digest(self, image: str) -> Optional[str]:
+        """Get the manifest digest of an image from its registry."""
+        cached = self._registry_digests.get(image)
+        if cached and time.monotonic() - cached[0] < self.REGISTRY_DIGEST_TTL:
+            return cached[1]
+        
+        import docker
+        
+        try:
+            digest = self._client.images.get_registry_data(image).id
+        except docker.errors.DockerException as e:
+            logger.debug(
+                "Failed to get registry digest",
+                **log_with_context(image=image, error=str(e))
+            )
+            digest = None
+        
+        self._registry_digests[image] = (time.monotonic(), digest)
+        return digest
 
+@functools.lru_cache(maxsize=1)
 def get_docker_manager() -> DockerManager:
-    """Get the global Docker manager instance."""
-    global _manager
-    if _manager is None:
-        _manager = DockerManager()
-    return _manager 
\ No newline at end of file
+    """
+    Get the global Docker manager instance.
+    
+    The manager is constructed on first call and reused for the rest of the
+    process, so Docker is only verified once per CLI invocation.
+    """
+    return DockerManager()
+
+def reset_docker_manager() -> None:
+    """Drop the cached Docker manager so the next call builds a new one."""
+    get_docker_manager.cache_clear() 
\ No newline at end of file
@@ -1,8 +1,13 @@
 """
 Docker Compose file generator for Easy Docker Deploy.
 """
+import os
+from pathlib import Path
 import yaml
 from ..config.docker import DockerConfig
+from ..utils.compat import yaml_safe_codec
+
+SafeDumper, _ = yaml_safe_codec()
 
 class DockerComposeGenerator:
     """Generates docker-compose.yml files."""
@@ -17,6 +22,38 @@ class DockerComposeGenerator:
         Returns:
             str: Generated docker-compose.yml content
         """
+        # Generate YAML with proper formatting
+        return yaml.dump(self._compose_config(config), Dumper=SafeDumper, default_flow_style=False, sort_keys=False)
+    
+    def write_compose_file(self, path: Path, config: DockerConfig) -> None:
+        """
+        Generate docker-compose.yml content and write it straight to disk.
+        
+        The YAML is emitted as UTF-8 bytes and handed to ``os.write``, bypassing
+        Python's buffered text layer.
+        
+        Args:
+            path: File to write
+            config: Docker configuration
+        """
+        data = yaml.dump(
+            self._compose_config(config),
+            Dumper=SafeDumper,
+            default_flow_style=False,
+            sort_keys=False,
+            encoding='utf-8'
+        )
+        
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+    
+    def _compose_config(self, config: DockerConfig) -> dict:
+        """Build the docker-compose structure for a single service."""
         compose_config = {
             "version": "3",
             "services": {
@@ -42,5 +79,4 @@ class DockerComposeGenerator:
         if config.environment:
             service["environment"] = config.environment
             
-        # Generate YAML with proper formatting
-        return yaml.dump(compose_config, default_flow_style=False, sort_keys=False) 
\ No newline at end of file
+        return compose_config 
\ No newline at end of file
@@ -2,15 +2,38 @@
 Deployment orchestrator for Easy Docker Deploy.
 """
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple, Union
 import docker
 from docker.errors import DockerException
 from ..docker.generator import DockerConfig
+from ..docker.manager import pull_concurrently
 
 class DeploymentError(Exception):
     """Base exception for deployment errors."""
     pass
 
+def _parse_ports(ports: List[str]) -> Dict[str, Union[str, Tuple[str, str]]]:
+    """Convert ``[ip:]host:container`` port strings to the SDK's ports mapping."""
+    mapping = {}
+    for port in ports:
+        host, sep, container = port.rpartition(':')
+        if not sep or not host or not container:
+            raise DeploymentError(f"Invalid port mapping: {port}")
+        ip, sep, host_port = host.rpartition(':')
+        mapping[container] = (ip, host_port) if sep else host
+    return mapping
+
+def _parse_volumes(volumes: List[str]) -> Dict[str, Dict[str, str]]:
+    """Convert ``source:target[:mode]`` volume strings to the SDK's volumes mapping."""
+    mapping = {}
+    for volume in volumes:
+        source, sep, target = volume.partition(':')
+        if not sep or not source or not target:
+            raise DeploymentError(f"Invalid volume mapping: {volume}")
+        target, _, mode = target.partition(':')
+        mapping[source] = {'bind': target, 'mode': mode or 'rw'}
+    return mapping
+
 class Deployer:
     """Handles the deployment of Docker containers."""
     
@@ -38,14 +61,39 @@ class Deployer:
         try:
             # Pull the image
             self.client.images.pull(config.image)
+        except DockerException as e:
+            raise DeploymentError(f"Failed to deploy container: {e}")
+        
+        return self._run_container(config)
+    
+    def deploy_containers(self, configs: List[DockerConfig], max_workers: int = 8) -> List[str]:
+        """
+        Deploy several containers, pulling their images concurrently first.
+        
+        Args:
+            configs: Configurations of the containers to deploy
+            max_workers: Maximum number of simultaneous image pulls
             
-            # Create and start the container
+        Returns:
+            IDs of the started containers, in the order of ``configs``
+        """
+        errors = pull_concurrently(
+            self.client.images.pull, (config.image for config in configs), max_workers
+        )
+        if errors:
+            details = "; ".join(f"{image}: {error}" for image, error in errors.items())
+            raise DeploymentError(f"Failed to pull images: {details}")
+        
+        return [self._run_container(config) for config in configs]
+    
+    def _run_container(self, config: DockerConfig) -> str:
+        """Create and start a container whose image is already available."""
+        try:
             container = self.client.containers.run(
                 image=config.image,
                 name=config.container_name,
-                ports={p.split(':')[1]: p.split(':')[0] for p in config.ports},
-                volumes={v.split(':')[0]: {'bind': v.split(':')[1], 'mode': 'rw'} 
-                        for v in config.volumes},
+                ports=_parse_ports(config.ports),
+                volumes=_parse_volumes(config.volumes),
                 environment=config.environment,
                 restart_policy={"Name": config.restart_policy},
                 detach=True
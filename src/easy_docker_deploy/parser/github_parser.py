@@ -1,20 +1,91 @@
 """
 GitHub repository parser for Easy Docker Deploy.
 """
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, asdict
+import functools
 import json
 import os
 from pathlib import Path
 import time
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
+from urllib.parse import urlsplit
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from rich.console import Console
+from ..utils.compat import DATACLASS_SLOTS
 from .markdown_parser import MarkdownParser
 import re
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 console = Console()
 
-@dataclass
+# Files and directories whose presence at a repository root indicates Docker support
+_DOCKER_FILES = frozenset({
+    'dockerfile',
+    'docker-compose.yml',
+    'docker-compose.yaml',
+    '.docker',
+    'docker'
+})
+
+_GIT_SUFFIX_RE = re.compile(r'\.git$')
+
+GITHUB_API_REPOS_URL = "https://api.github.com/repos"
+
+GITHUB_GRAPHQL_URL = "https://api.github.com/graphql"
+
+# Repositories looked up per GraphQL request
+GRAPHQL_BATCH_SIZE = 100
+
+# Concurrent REST requests used when GraphQL cannot resolve a repository
+DOCKER_CHECK_WORKERS = 32
+
+def _github_repo(url: str) -> Optional[Tuple[str, str]]:
+    """Get the owner and name of a GitHub repository from an HTTPS or SSH URL."""
+    if url.startswith('git@github.com:'):
+        path = url[len('git@github.com:'):]
+    else:
+        parts = urlsplit(url)
+        if parts.hostname not in ('github.com', 'www.github.com'):
+            return None
+        path = parts.path
+    
+    segments = [segment for segment in path.split('/') if segment]
+    if len(segments) < 2:
+        return None
+    return segments[0], _GIT_SUFFIX_RE.sub('', segments[1])
+
+def _create_session() -> requests.Session:
+    """Create an HTTP session that pools and retries GitHub connections."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=DOCKER_CHECK_WORKERS,
+        pool_maxsize=DOCKER_CHECK_WORKERS,
+        max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504])
+    )
+    session.mount("https://", adapter)
+    session.headers.update({
+        "User-Agent": "easy-docker-deploy",
+        "Accept-Encoding": "gzip"
+    })
+    return session
+
+def _dump_json(data) -> bytes:
+    """Serialize cache data, with dataclasses as plain objects."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, default=asdict).encode('utf-8')
+
+_load_json = orjson.loads if orjson is not None else json.loads
+
+@dataclass(**DATACLASS_SLOTS)
 class Application:
     """Application metadata."""
     name: str
@@ -56,16 +127,15 @@ class Application:
             deployment_guide=data["deployment_guide"]
         )
 
+    @property
+    def search_text(self) -> str:
+        """Lowercased name, description, language and category for substring search."""
+        # NUL-separated so a query cannot match across two fields
+        return "\0".join(filter(None, (self.name, self.description, self.language, self.category))).lower()
+
     def matches_search(self, query: str) -> bool:
         """Check if the application matches a search query."""
-        query = query.lower()
-        searchable_fields = [
-            self.name.lower() if self.name else "",
-            self.description.lower() if self.description else "",
-            self.language.lower() if self.language else "",
-            self.category.lower() if self.category else ""
-        ]
-        return any(query in field for field in searchable_fields)
+        return query.lower() in self.search_text
 
     @property
     def docker_available(self) -> bool:
@@ -75,99 +145,211 @@ class Application:
 class GithubParser:
     """Parser for GitHub repositories containing application metadata."""
     
+    # Docker-related keywords for better detection
+    docker_keywords = (
+        'docker',
+        'container',
+        'docker-compose',
+        'dockerfile',
+        'containerized',
+        'docker hub',
+        'docker image',
+        'docker container',
+        '🐳'  # Docker whale emoji
+    )
+    
+    _KEYWORD_RE = re.compile('|'.join(map(re.escape, docker_keywords)), re.IGNORECASE)
+    _DOCKER_HUB_RE = re.compile(r'hub\.docker\.com/r/([^/\s]+/[^/\s)]+)')
+    _GHCR_RE = re.compile(r'ghcr\.io/([^/\s]+/[^/\s]+)')
+    
+    # Category headings and application bullets, scanned over the whole document
+    _LINE_RE = re.compile(r'^[ \t]*(?:(?P<cat>###.*?)|(?P<app>- .*?))[ \t\r]*$', re.MULTILINE)
+    
     def __init__(self):
         """Initialize the parser."""
         self.base_url = "https://raw.githubusercontent.com/awesome-selfhosted/awesome-selfhosted/master/README.md"
         self.applications = []
+        self._search_haystack: List[Tuple[str, Application]] = []
+        self._by_category: Dict[str, List[Application]] = {}
+        self._docker_ready: List[Application] = []
+        self._indexed_applications = None
         self.cache_dir = Path.home() / ".easy-docker-deploy" / "cache"
         self.cache_file = self.cache_dir / "applications.json"
+        self.docker_cache_file = self.cache_dir / "docker_availability.json"
         self.cache_expiry = 24 * 60 * 60  # 24 hours in seconds
+        self._session = _create_session()
         self._ensure_cache_dir()
-        
-        # Docker-related keywords for better detection
-        self.docker_keywords = [
-            'docker',
-            'container',
-            'docker-compose',
-            'dockerfile',
-            'containerized',
-            'docker hub',
-            'docker image',
-            'docker container',
-            '🐳'  # Docker whale emoji
-        ]
+        self._docker_availability = self._load_docker_availability()
     
     def _ensure_cache_dir(self):
         """Ensure cache directory exists."""
         self.cache_dir.mkdir(parents=True, exist_ok=True)
     
-    def _load_cache(self) -> Optional[List[Application]]:
-        """Load applications from cache if available and not expired."""
+    def _read_cache_file(self) -> Optional[dict]:
+        """Read the raw cache file regardless of its age."""
         if not self.cache_file.exists():
             return None
             
         try:
-            with open(self.cache_file, 'r', encoding='utf-8') as f:
-                cache_data = json.load(f)
+            return _load_json(self.cache_file.read_bytes())
+        except Exception:
+            return None
+    
+    def _load_cache(self) -> Optional[List[Application]]:
+        """Load applications from cache if available and not expired."""
+        cache_data = self._read_cache_file()
+        if cache_data is None:
+            return None
             
+        try:
             if time.time() - cache_data["timestamp"] > self.cache_expiry:
                 return None
             
-            return [Application.from_dict(app_data) for app_data in cache_data["applications"]]
+            return [Application(**app_data) for app_data in cache_data["applications"]]
         except Exception:
             return None
     
-    def _save_cache(self, applications: List[Application]):
-        """Save applications to cache."""
+    def _save_cache(self, applications: List[Application], etag: Optional[str] = None,
+                    last_modified: Optional[str] = None):
+        """Save applications to cache along with the validators of the fetched README."""
+        cache_data = {
+            "timestamp": time.time(),
+            "etag": etag,
+            "last_modified": last_modified,
+            "applications": applications
+        }
+        self.cache_file.write_bytes(_dump_json(cache_data))
+    
+    def _load_docker_availability(self) -> Dict[str, bool]:
+        """Load remembered repository Docker checks if not expired."""
+        try:
+            cache_data = _load_json(self.docker_cache_file.read_bytes())
+            if time.time() - cache_data["timestamp"] > self.cache_expiry:
+                return {}
+            return cache_data["repositories"]
+        except Exception:
+            return {}
+    
+    def _save_docker_availability(self):
+        """Persist repository Docker checks, including negative results."""
         cache_data = {
             "timestamp": time.time(),
-            "applications": [app.to_dict() for app in applications]
+            "repositories": self._docker_availability
         }
-        with open(self.cache_file, 'w', encoding='utf-8') as f:
-            json.dump(cache_data, f, indent=2)
+        self.docker_cache_file.write_bytes(_dump_json(cache_data))
+    
+    def _prefetch_docker_availability(self, urls: List[str]):
+        """Check many GitHub repositories for Docker files ahead of parsing.
+        
+        Uses batched GraphQL queries when ``GITHUB_TOKEN`` is set, then runs the
+        REST check concurrently for any repositories still unresolved.
+        
+        Args:
+            urls: Repository URLs to check
+        """
+        urls = [
+            url for url in dict.fromkeys(urls)
+            if url and 'github.com' in url and url not in self._docker_availability
+        ]
+        if not urls:
+            return
+        
+        token = os.environ.get("GITHUB_TOKEN")
+        if token:
+            self._query_docker_availability(urls, token)
+        
+        # Each REST check is an independent request, so run them side by side
+        remaining = [url for url in urls if url not in self._docker_availability]
+        if remaining:
+            with ThreadPoolExecutor(max_workers=min(DOCKER_CHECK_WORKERS, len(remaining))) as executor:
+                list(executor.map(self._check_docker_availability, remaining))
+    
+    def _query_docker_availability(self, urls: List[str], token: str):
+        """Check GitHub repositories for Docker files with batched GraphQL queries.
+        
+        Args:
+            urls: Repository URLs to check
+            token: GitHub token; GraphQL does not allow anonymous access
+        """
+        pending = []
+        for url in urls:
+            if repo := _github_repo(url):
+                pending.append((url, *repo))
+        
+        for start in range(0, len(pending), GRAPHQL_BATCH_SIZE):
+            batch = pending[start:start + GRAPHQL_BATCH_SIZE]
+            params = []
+            fields = []
+            variables = {}
+            for i, (_, owner, name) in enumerate(batch):
+                params.append(f"$o{i}: String!, $n{i}: String!")
+                fields.append(
+                    f'r{i}: repository(owner: $o{i}, name: $n{i}) '
+                    '{ object(expression: "HEAD:") { ... on Tree { entries { name } } } }'
+                )
+                variables[f"o{i}"] = owner
+                variables[f"n{i}"] = name
+            query = f"query({', '.join(params)}) {{ {' '.join(fields)} }}"
+            
+            try:
+                response = self._session.post(
+                    GITHUB_GRAPHQL_URL,
+                    json={"query": query, "variables": variables},
+                    headers={"Authorization": f"bearer {token}"}
+                )
+                response.raise_for_status()
+                data = response.json().get("data") or {}
+            except (requests.RequestException, ValueError):
+                continue
+            
+            for i, (url, _, _) in enumerate(batch):
+                if f"r{i}" not in data:
+                    continue
+                tree = (data[f"r{i}"] or {}).get("object") or {}
+                entries = {entry["name"].lower() for entry in tree.get("entries", ())}
+                self._docker_availability[url] = bool(entries & _DOCKER_FILES)
     
     def _check_docker_availability(self, url: str) -> bool:
         """Check if a repository has Docker support."""
+        if url in self._docker_availability:
+            return self._docker_availability[url]
+        
         try:
-            # Check common Docker-related files
-            docker_files = [
-                'Dockerfile',
-                'docker-compose.yml',
-                'docker-compose.yaml',
-                '.docker/',
-                'docker/'
-            ]
-            
-            # Convert GitHub URLs to raw content URLs
-            if 'github.com' in url:
-                # Convert HTTPS clone URL to API URL
-                api_url = url.replace('github.com', 'api.github.com/repos')
-                if api_url.endswith('.git'):
-                    api_url = api_url[:-4]
-                
+            if repo := _github_repo(url):
                 # Get repository contents
-                response = requests.get(f"{api_url}/contents")
+                owner, name = repo
+                response = self._session.get(f"{GITHUB_API_REPOS_URL}/{owner}/{name}/contents")
                 if response.status_code == 200:
                     contents = response.json()
-                    filenames = [item['name'].lower() for item in contents if isinstance(item, dict)]
-                    return any(docker_file.lower() in filenames for docker_file in docker_files)
+                    filenames = {item['name'].lower() for item in contents if isinstance(item, dict)}
+                    self._docker_availability[url] = bool(filenames & _DOCKER_FILES)
+                    return self._docker_availability[url]
+                if response.status_code == 404:
+                    self._docker_availability[url] = False
             
             return False
         except Exception:
             return False
     
-    def _extract_docker_url(self, description: str, repository_url: str) -> Optional[str]:
-        """Extract Docker image URL from description or repository."""
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _registry_url(description: str) -> Optional[str]:
+        """Find a Docker Hub or GitHub Container Registry URL in a description."""
         # Check for Docker Hub URL
-        docker_hub_pattern = r'hub\.docker\.com/r/([^/\s]+/[^/\s)]+)'
-        if match := re.search(docker_hub_pattern, description):
+        if match := GithubParser._DOCKER_HUB_RE.search(description):
             return f"https://hub.docker.com/r/{match.group(1)}"
         
         # Check for GitHub Container Registry
-        ghcr_pattern = r'ghcr\.io/([^/\s]+/[^/\s]+)'
-        if match := re.search(ghcr_pattern, description):
+        if match := GithubParser._GHCR_RE.search(description):
             return match.group(0)
         
+        return None
+    
+    def _extract_docker_url(self, description: str, repository_url: str) -> Optional[str]:
+        """Extract Docker image URL from description or repository."""
+        if registry_url := self._registry_url(description):
+            return registry_url
+        
         # Check if repository URL contains dockerfile
         if repository_url and 'dockerfile' in repository_url.lower():
             return repository_url
@@ -175,35 +357,11 @@ class GithubParser:
         # If no explicit Docker URL found but has repository URL, check repository
         if repository_url and self._check_docker_availability(repository_url):
             # Convert GitHub URL to potential GitHub Container Registry URL
-            if 'github.com' in repository_url:
-                org_repo = repository_url.split('github.com/')[-1].strip('/')
-                if org_repo.endswith('.git'):
-                    org_repo = org_repo[:-4]
-                return f"ghcr.io/{org_repo}"
+            if repo := _github_repo(repository_url):
+                return f"ghcr.io/{repo[0]}/{repo[1]}"
         
         return None
     
-    def _is_docker_ready(self, description: str, repository_url: str) -> bool:
-        """Check if an application is Docker-ready."""
-        # Check for Docker keywords in description
-        desc_lower = description.lower()
-        if any(keyword in desc_lower for keyword in self.docker_keywords):
-            return True
-        
-        # Check for Docker Hub or GitHub Container Registry URLs
-        if self._extract_docker_url(description, repository_url):
-            return True
-        
-        # Check if URL contains dockerfile
-        if repository_url and 'dockerfile' in repository_url.lower():
-            return True
-        
-        # Check repository for Docker files
-        if repository_url and self._check_docker_availability(repository_url):
-            return True
-        
-        return False
-    
     def parse_content(self, content: str, return_dict: bool = True) -> Union[List[Application], Dict[str, Application]]:
         """Parse repository content and extract application metadata.
         
@@ -216,43 +374,51 @@ class GithubParser:
             Either a dictionary mapping application names to Application objects,
             or a list of Application objects, depending on return_dict parameter.
         """
-        applications = []
+        entries = []
         current_category = None
         
-        for line in content.split('\n'):
-            line = line.strip()
-            if not line:
-                continue
-                
+        for match in self._LINE_RE.finditer(content):
             # Try to match category
-            if line.startswith('###'):
-                current_category = line.lstrip('#').strip()
+            if category := match.group('cat'):
+                current_category = category.lstrip('#').strip()
                 if current_category.startswith('[') and current_category.endswith(']'):
                     current_category = current_category[1:-1]
                 continue
             
             # Try to match application
-            if line.startswith('- ') and current_category:
-                result = MarkdownParser.parse_application_line(line)
+            if current_category:
+                result = MarkdownParser.parse_application_line(match.group('app'))
                 if result:
-                    name, url, desc, lang, license_type = result
-                    docker_ready = self._is_docker_ready(desc, url)
-                    docker_url = self._extract_docker_url(desc, url) if docker_ready else None
-                    app = Application(
-                        name=name,
-                        description=desc,
-                        category=current_category,
-                        language=lang,
-                        license_type=license_type,
-                        docker_ready=docker_ready,
-                        docker_url=docker_url,
-                        repository_url=url,
-                        deployment_guide=None
-                    )
-                    applications.append(app)
+                    entries.append((current_category, result))
+        
+        # Resolve repository Docker checks in bulk before building applications
+        known = len(self._docker_availability)
+        self._prefetch_docker_availability([result[1] for _, result in entries])
+        
+        applications = []
+        for category, (name, url, desc, lang, license_type) in entries:
+            # A found Docker URL already implies readiness, so only fall back to keywords
+            docker_url = self._extract_docker_url(desc, url)
+            docker_ready = docker_url is not None or bool(self._KEYWORD_RE.search(desc))
+            app = Application(
+                name=name,
+                description=desc,
+                category=category,
+                language=lang,
+                license_type=license_type,
+                docker_ready=docker_ready,
+                docker_url=docker_url,
+                repository_url=url,
+                deployment_guide=None
+            )
+            applications.append(app)
+        
+        if len(self._docker_availability) != known:
+            self._save_docker_availability()
         
         # Store applications in instance for searching
         self.applications = applications
+        self._index_applications()
         
         if return_dict:
             return {app.name: app for app in applications}
@@ -261,7 +427,22 @@ class GithubParser:
     def fetch_repository(self) -> List[Application]:
         """Fetch and parse the awesome-selfhosted repository."""
         try:
-            response = requests.get(self.base_url)
+            # Revalidate against the previous download so an unchanged README costs no body
+            cache_data = self._read_cache_file() or {}
+            headers = {}
+            if cache_data.get("etag"):
+                headers["If-None-Match"] = cache_data["etag"]
+            if cache_data.get("last_modified"):
+                headers["If-Modified-Since"] = cache_data["last_modified"]
+            
+            response = self._session.get(self.base_url, headers=headers)
+            
+            if response.status_code == 304 and "applications" in cache_data:
+                applications = [Application(**app_data) for app_data in cache_data["applications"]]
+                self._save_cache(applications, cache_data.get("etag"), cache_data.get("last_modified"))
+                self.applications = applications
+                return applications
+            
             response.raise_for_status()
             content = response.text
             
@@ -269,7 +450,11 @@ class GithubParser:
             applications = self.parse_content(content, return_dict=False)
             
             # Cache the results
-            self._save_cache(applications)
+            self._save_cache(
+                applications,
+                response.headers.get("ETag"),
+                response.headers.get("Last-Modified")
+            )
             
             # Store in instance
             self.applications = applications
@@ -300,34 +485,52 @@ class GithubParser:
         """Get all parsed applications."""
         return self.applications
     
-    def search_applications(self, query: str) -> List[Application]:
-        """Search for applications by name or description."""
+    def _index_applications(self):
+        """Precompute search text, category and Docker indexes for the applications."""
         if isinstance(self.applications, dict):
-            applications = list(self.applications.values())
+            applications = self.applications.values()
         else:
             applications = self.applications
-            
+        
+        self._search_haystack = [(app.search_text, app) for app in applications]
+        
+        by_category = defaultdict(list)
+        for app in applications:
+            by_category[app.category.lower()].append(app)
+        self._by_category = dict(by_category)
+        self._docker_ready = [app for app in applications if app.docker_ready]
+        self._indexed_applications = self.applications
+    
+    def _ensure_indexed(self):
+        """Rebuild the indexes if the applications have been replaced."""
+        if self._indexed_applications is not self.applications:
+            self._index_applications()
+    
+    def search_applications(self, query: str) -> List[Application]:
+        """Search for applications by name or description."""
+        self._ensure_indexed()
+        
+        query = query.lower()
         return [
-            app for app in applications
-            if app.matches_search(query)
+            app for haystack, app in self._search_haystack
+            if query in haystack
         ]
     
     def get_applications_by_category(self, category: str) -> List[Application]:
         """Get all applications in a specific category."""
-        return [
-            app for app in self.applications
-            if app.category.lower() == category.lower()
-        ]
+        self._ensure_indexed()
+        return list(self._by_category.get(category.lower(), ()))
     
     def get_docker_ready_applications(self) -> List[Application]:
         """Get all applications that have Docker support."""
-        return [
-            app for app in self.applications
-            if app.docker_ready
-        ]
+        self._ensure_indexed()
+        return list(self._docker_ready)
     
     def clear_cache(self):
         """Clear the application cache."""
+        self._docker_availability.clear()
+        if self.docker_cache_file.exists():
+            self.docker_cache_file.unlink()
         if self.cache_file.exists():
             try:
                 self.cache_file.unlink()
@@ -1,17 +1,157 @@
 """
 Markdown parser for the awesome-selfhosted repository.
 """
-import re
-from typing import Dict, List, Optional, Tuple, Union
+try:
+    import regex as re  # Optional drop-in for re; also backtracking, so no linear-time guarantee
+except ImportError:
+    import re
+
+try:
+    import re2 as _linear_re  # google-re2: matching time linear in the line length
+except ImportError:
+    _linear_re = re
+import io
+import json
+from collections import defaultdict
+from functools import cached_property, lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple, Union
 from rich.console import Console
 import requests
-from dataclasses import dataclass
+from dataclasses import dataclass, asdict
+from ..config.settings import get_config
+from ..utils.compat import DATACLASS_SLOTS
 from ..utils.logging import get_logger
 
 console = Console()
 logger = get_logger(__name__)
 
-@dataclass
+# Line patterns shared by every parser instance
+_CATEGORY_LINE_RE = re.compile(r'^###\s+\[?([^\]]+)\]?')
+_APPLICATION_LINE_RE = _linear_re.compile(r'^\s*-\s*\[([^\]]+)\]\(([^)]+)\)\s*-\s*(.+?)(?:\s*`([^`]+)`)?(?:\s*\[([^\]]+)\])?(?:\s*\([^)]+\))?\s*$')
+
+# Application, license and table-of-contents list items, matched in one pass
+# together with a heading alternative; the outer named group tells them apart
+_LIST_ITEM_PATTERNS = (
+    r'|(?P<app>\s*-\s*\[(?P<name>[^\]]+)\]\((?P<url>[^)]+)\)\s*-\s*(?P<description>.+?)'
+    r'(?:\s*`(?P<license_info>[^`]+)`)?(?:\s*\([^)]+\))?\s*$)'
+    r'|(?P<license>\s*-\s*`[^`]+`\s*-\s*\[[^\]]+\]\([^)]+\)\s*$)'
+    r'|(?P<toc>\s*-\s*\[[^\]]+\]\(#[^)]+\)\s*$)'
+)
+_HEADING_LINE_RE = re.compile(r'^(?:(?P<category>#+\s+(?P<heading>.+?))\s*$' + _LIST_ITEM_PATTERNS + ')')
+_SECTION_LINE_RE = re.compile(r'^(?:(?P<category>## \[?(?P<heading>[^\]]+)\]?)' + _LIST_ITEM_PATTERNS + ')')
+
+_GITHUB_DOCKER_REPO_RE = re.compile(r'/docker-[a-zA-Z0-9-]+/?$')
+_DOCKER_HUB_RE = re.compile(r'(?:hub\.docker\.com|docker\.io|quay\.io)/(?:r/)?[a-zA-Z0-9_-]+/[a-zA-Z0-9_-]+')
+_DOCKER_KEYWORD_RE = re.compile(r'container|docker', re.IGNORECASE)
+_DOCKER_REFERENCE_RE = re.compile(r'(?:docker(?:ized|file|hub|compose)?|container(?:ized)?)')
+
+README_URL = 'https://raw.githubusercontent.com/awesome-selfhosted/awesome-selfhosted/master/README.md'
+
+# Format of the saved parse results; bump whenever parsing or Application
+# changes, so results from older parser code are not reused
+PARSED_CACHE_VERSION = 1
+
+# Section headings whose list items are not applications
+_LICENSE_HEADERS = ('# license', '## license')
+_TOC_HEADERS = ('# table of contents', '## table of contents')
+
+# Returned by the line scanner when only the full regex can decide
+_UNDECIDED = object()
+
+# Closing delimiter of each optional group that may trail a description
+_TAIL_GROUPS = (('`', '`'), ('[', ']'), ('(', ')'))
+
+def _scan_tail(text: str, start: int) -> Optional[Tuple[Optional[str], Optional[str]]]:
+    """
+    Match the optional `lang`, [license] and (link) groups ending a line.
+    
+    Args:
+        text: Stripped description part of the line
+        start: Index the trailing groups must start at
+        
+    Returns:
+        Language and license, or None if the rest of the line is not made
+        up of those groups in order
+    """
+    groups = []
+    i = start
+    for opening, closing in _TAIL_GROUPS:
+        if text.startswith(opening, i):
+            end = text.find(closing, i + 1)
+            if end <= i + 1:
+                return None
+            groups.append(text[i + 1:end])
+            i = end + 1
+            while i < len(text) and text[i].isspace():
+                i += 1
+        else:
+            groups.append(None)
+    
+    if i != len(text):
+        return None
+    return groups[0], groups[1]
+
+def _scan_application_line(line: str):
+    """
+    Split an application line without the regex engine.
+    
+    Walks ``- [name](url) - description `lang` [license] (link)`` with string
+    searches, reproducing the shortest-description choice of the regex in
+    ``MarkdownParser.parse_application_line``. Lines where that choice
+    depends on backtracking into whitespace return ``_UNDECIDED``.
+    
+    Args:
+        line: Markdown line to scan
+        
+    Returns:
+        Tuple of name, url, description, language and license, None if the
+        line is not an application, or ``_UNDECIDED``
+    """
+    if '\n' in line:
+        return _UNDECIDED
+    
+    text = line.lstrip()
+    if not text.startswith('-'):
+        return None
+    text = text[1:].lstrip()
+    if not text.startswith('['):
+        return None
+    
+    name_end = text.find(']', 1)
+    if name_end <= 1 or not text.startswith('(', name_end + 1):
+        return None
+    url_end = text.find(')', name_end + 2)
+    if url_end <= name_end + 2:
+        return None
+    name = text[1:name_end]
+    url = text[name_end + 2:url_end]
+    
+    rest = text[url_end + 1:].lstrip()
+    if not rest.startswith('-'):
+        return None
+    rest = rest[1:].strip()
+    if not rest:
+        return _UNDECIDED
+    
+    # Trailing groups can only be present if the line ends by closing one
+    if rest[-1] not in '`])':
+        return name, url, rest.rstrip('.'), None, None
+    
+    # The description is the shortest prefix followed only by trailing groups
+    for i, char in enumerate(rest):
+        if char not in '`[(':
+            continue
+        desc = rest[:i].rstrip()
+        if not desc:
+            return _UNDECIDED
+        tail = _scan_tail(rest, i)
+        if tail is not None:
+            return (name, url, desc.rstrip('.'), *tail)
+    
+    return name, url, rest.rstrip('.'), None, None
+
+@dataclass(**DATACLASS_SLOTS)
 class Application:
     """Represents a self-hosted application."""
     name: str
@@ -51,20 +191,102 @@ class ParseError(ParserError):
     """Raised when content cannot be parsed correctly."""
     pass
 
+@lru_cache(maxsize=1)
+def _get_session() -> requests.Session:
+    """Get the HTTP session shared by README fetches, so connections are reused."""
+    session = requests.Session()
+    session.headers.update({
+        'User-Agent': 'easy-docker-deploy',
+        'Accept-Encoding': 'gzip'
+    })
+    return session
+
+def _fetch_readme() -> Tuple[str, Optional[str]]:
+    """
+    Fetch the awesome-selfhosted README, revalidating a copy kept on disk.
+    
+    The last download and its ETag live in the cache directory, so repeated
+    runs send ``If-None-Match`` and read the file back on a 304.
+    
+    Returns:
+        README content and its ETag, if the server sent one
+        
+    Raises:
+        requests.RequestException: If the request fails
+    """
+    cache_dir = get_config().cache_dir
+    readme_file = cache_dir / 'README.md'
+    etag_file = cache_dir / 'README.etag'
+    
+    etag = None
+    if readme_file.exists() and etag_file.exists():
+        etag = etag_file.read_text(encoding='utf-8')
+    
+    response = _get_session().get(README_URL, headers={'If-None-Match': etag} if etag else {})
+    if response.status_code == 304:
+        try:
+            return readme_file.read_text(encoding='utf-8'), etag
+        except (OSError, UnicodeDecodeError) as e:
+            # The cached copy vanished or is unreadable; download it again
+            logger.debug(f"Failed to read cached README: {str(e)}")
+            response = _get_session().get(README_URL)
+    response.raise_for_status()
+    
+    content = response.text
+    etag = response.headers.get('ETag')
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        readme_file.write_text(content, encoding='utf-8')
+        if etag:
+            etag_file.write_text(etag, encoding='utf-8')
+        elif etag_file.exists():
+            etag_file.unlink()
+    except OSError as e:
+        logger.debug(f"Failed to cache README: {str(e)}")
+    return content, etag
+
+def _parsed_cache_file(parser_name: str) -> Path:
+    """Get the file holding a parser's results for the cached README."""
+    return get_config().cache_dir / f'{parser_name}-parsed.json'
+
+def _load_parsed(parser_name: str, etag: Optional[str]) -> Optional[Tuple[List['Application'], Set[str]]]:
+    """Load parse results saved by this parser version for the README with the given ETag."""
+    if not etag:
+        return None
+    try:
+        data = json.loads(_parsed_cache_file(parser_name).read_bytes())
+        if data['version'] != PARSED_CACHE_VERSION or data['etag'] != etag:
+            return None
+        
+        applications = [Application(**app_data) for app_data in data['applications']]
+        return applications, set(data['categories'])
+    except Exception:
+        return None
+
+def _save_parsed(parser_name: str, etag: Optional[str], applications: List['Application'],
+                 categories: Set[str]) -> None:
+    """Save parse results so an unchanged README is not parsed again."""
+    if not etag:
+        return
+    data = {
+        'version': PARSED_CACHE_VERSION,
+        'etag': etag,
+        'categories': list(categories),
+        'applications': [asdict(app) for app in applications]
+    }
+    try:
+        _parsed_cache_file(parser_name).write_text(json.dumps(data), encoding='utf-8')
+    except OSError as e:
+        logger.debug(f"Failed to cache parsed applications: {str(e)}")
+
 class GithubParser:
     """Parser for GitHub markdown files."""
     
     def __init__(self):
         self.cache = {}
-        self.categories = {}  # Changed from set to dict for better organization
+        self.categories: Set[str] = set()
         self.applications = []
         
-        # Improved regex patterns
-        self.category_pattern = re.compile(r'^#+\s+(.+?)\s*$')
-        self.application_pattern = re.compile(r'^\s*-\s*\[([^\]]+)\]\(([^)]+)\)\s*-\s*(.+?)(?:\s*`([^`]+)`)?(?:\s*\([^)]+\))?\s*$')
-        self.license_pattern = re.compile(r'^\s*-\s*`([^`]+)`\s*-\s*\[([^\]]+)\]\(([^)]+)\)\s*$')
-        self.toc_pattern = re.compile(r'^\s*-\s*\[([^\]]+)\]\(#[^)]+\)\s*$')
-        
     def parse_content(self, content: str) -> None:
         """Parse the markdown content."""
         current_category = None
@@ -72,16 +294,17 @@ class GithubParser:
         in_toc_section = False
         
         try:
-            for line in content.split('\n'):
+            for line in io.StringIO(content):
                 line = line.strip()
                 if not line:
                     continue
                     
                 # Check if we're in a special section
-                if any(line.lower().startswith(header) for header in ['# license', '## license']):
+                line_lower = line.lower()
+                if line_lower.startswith(_LICENSE_HEADERS):
                     in_license_section = True
                     continue
-                elif any(line.lower().startswith(header) for header in ['# table of contents', '## table of contents']):
+                elif line_lower.startswith(_TOC_HEADERS):
                     in_toc_section = True
                     continue
                 elif line.startswith('#'):
@@ -92,21 +315,22 @@ class GithubParser:
                 if in_license_section or in_toc_section:
                     continue
                 
+                match = _HEADING_LINE_RE.match(line)
+                kind = match.lastgroup if match else None
+                
                 # Try to match category
-                if category_match := self.category_pattern.match(line):
-                    current_category = category_match.group(1)
-                    if current_category not in self.categories:
-                        self.categories[current_category] = []
+                if kind == 'category':
+                    current_category = match.group('heading')
+                    self.categories.add(current_category)
                     continue
                 
                 # Try to match application
-                if app_match := self.application_pattern.match(line):
+                if kind == 'app':
                     if not current_category:
                         logger.warning(f"Found application entry outside of category: {line}")
                         continue
                         
-                    name, url, description = app_match.group(1, 2, 3)
-                    license_info = app_match.group(4) if len(app_match.groups()) > 3 else None
+                    name, url, description, license_info = match.group('name', 'url', 'description', 'license_info')
                     
                     # Clean up description
                     description = description.strip()
@@ -114,8 +338,7 @@ class GithubParser:
                         description = description[:-1]
                     
                     # Determine if application is Docker-ready
-                    docker_ready = any(keyword in description.lower() 
-                                     for keyword in ['docker', 'container', 'containerized'])
+                    docker_ready = bool(_DOCKER_KEYWORD_RE.search(description))
                     
                     app = Application(
                         name=name,
@@ -126,17 +349,17 @@ class GithubParser:
                         docker_ready=docker_ready
                     )
                     self.applications.append(app)
-                    self.categories[current_category].append(app)
                     continue
                 
                 # Skip known patterns
-                if self.license_pattern.match(line) or self.toc_pattern.match(line):
+                if kind in ('license', 'toc'):
                     continue
                 
                 # Only warn about unparsed lines if they look like they might be important
                 if line.startswith('-') and not line.startswith('---'):
                     logger.warning(f"Failed to parse line: {line}")
-                    
+            
+            self.__dict__.pop('by_category', None)
         except Exception as e:
             logger.error(f"Error parsing content: {str(e)}")
             raise ParseError(f"Failed to parse content: {str(e)}") from e
@@ -152,7 +375,13 @@ class GithubParser:
         if not self.applications:
             try:
                 content = self._fetch_content()
-                self.parse_content(content)
+                etag = self.cache.get('etag')
+                if parsed := _load_parsed('github', etag):
+                    self.applications, self.categories = parsed
+                    self.__dict__.pop('by_category', None)
+                else:
+                    self.parse_content(content)
+                    _save_parsed('github', etag, self.applications, self.categories)
             except Exception as e:
                 logger.error(f"Failed to load applications: {str(e)}")
                 raise
@@ -160,6 +389,14 @@ class GithubParser:
         # Return as list by default, but provide option to get as dict
         return self.applications
     
+    @cached_property
+    def by_category(self) -> Dict[str, List[Application]]:
+        """Applications grouped by category, built on first access."""
+        grouped = defaultdict(list)
+        for app in self.applications:
+            grouped[app.category].append(app)
+        return grouped
+    
     def get_applications_dict(self) -> Dict[str, Application]:
         """Get applications as a dictionary keyed by name."""
         return {app.name: app for app in self.load_applications()}
@@ -169,11 +406,7 @@ class GithubParser:
         if 'content' not in self.cache:
             try:
                 logger.info("Fetching repository content...")
-                response = requests.get(
-                    'https://raw.githubusercontent.com/awesome-selfhosted/awesome-selfhosted/master/README.md'
-                )
-                response.raise_for_status()
-                self.cache['content'] = response.text
+                self.cache['content'], self.cache['etag'] = _fetch_readme()
                 logger.debug("Content fetched successfully")
             except requests.RequestException as e:
                 logger.error(f"Failed to fetch content: {str(e)}")
@@ -185,6 +418,7 @@ class GithubParser:
         self.cache.clear()
         self.categories.clear()
         self.applications.clear()
+        self.__dict__.pop('by_category', None)
         logger.debug("Parser cache cleared")
 
 class MarkdownParser:
@@ -201,22 +435,10 @@ class MarkdownParser:
     
     def __init__(self):
         """Initialize the parser."""
-        self.categories = {}
+        self.categories: Set[str] = set()
         self.applications = []
         self.current_category = None
         self._content_loaded = False
-        
-        # Regular expressions for parsing
-        self.category_pattern = re.compile(r'^## \[?([^\]]+)\]?')
-        self.application_pattern = re.compile(
-            r'^\s*-\s*\[([^\]]+)\]\(([^)]+)\)\s*-\s*(.+?)(?:\s*`([^`]+)`)?(?:\s*\([^)]+\))?\s*$'
-        )
-        self.license_pattern = re.compile(
-            r'^\s*-\s*`([^`]+)`\s*-\s*\[([^\]]+)\]\(([^)]+)\)\s*$'
-        )
-        self.toc_pattern = re.compile(
-            r'^\s*-\s*\[([^\]]+)\]\(#[^)]+\)\s*$'
-        )
     
     def parse_content(self, content: str) -> None:
         """Parse the markdown content."""
@@ -227,16 +449,17 @@ class MarkdownParser:
         in_license_section = False
         in_toc_section = False
         
-        for line in content.split('\n'):
+        for line in io.StringIO(content):
             line = line.strip()
             if not line:
                 continue
             
             # Check if we're in a special section
-            if any(line.lower().startswith(header) for header in ['# license', '## license']):
+            line_lower = line.lower()
+            if line_lower.startswith(_LICENSE_HEADERS):
                 in_license_section = True
                 continue
-            elif any(line.lower().startswith(header) for header in ['# table of contents', '## table of contents']):
+            elif line_lower.startswith(_TOC_HEADERS):
                 in_toc_section = True
                 continue
             elif line.startswith('#'):
@@ -247,19 +470,18 @@ class MarkdownParser:
             if in_license_section or in_toc_section:
                 continue
             
+            match = _SECTION_LINE_RE.match(line)
+            kind = match.lastgroup if match else None
+            
             # Try to match category
-            category_match = self.category_pattern.match(line)
-            if category_match:
-                current_category = category_match.group(1)
-                if current_category not in self.categories:
-                    self.categories[current_category] = []
+            if kind == 'category':
+                current_category = match.group('heading')
+                self.categories.add(current_category)
                 continue
             
             # Try to match application
-            app_match = self.application_pattern.match(line)
-            if app_match and current_category:
-                name, url, description = app_match.group(1, 2, 3)
-                license_info = app_match.group(4) if len(app_match.groups()) > 3 else None
+            if kind == 'app' and current_category:
+                name, url, description, license_info = match.group('name', 'url', 'description', 'license_info')
                 
                 # Clean up description
                 description = description.strip()
@@ -267,8 +489,7 @@ class MarkdownParser:
                     description = description[:-1]
                 
                 # Determine if application is Docker-ready
-                docker_ready = any(keyword in description.lower() 
-                                 for keyword in ['docker', 'container', 'containerized'])
+                docker_ready = bool(_DOCKER_KEYWORD_RE.search(description))
                 
                 app = Application(
                     name=name,
@@ -279,37 +500,47 @@ class MarkdownParser:
                     docker_ready=docker_ready
                 )
                 self.applications.append(app)
-                self.categories[current_category].append(app)
                 continue
             
             # Skip known patterns
-            if self.license_pattern.match(line) or self.toc_pattern.match(line):
+            if kind in ('license', 'toc'):
                 continue
             
             # Only warn about unparsed lines if they look like they might be important
             if line.startswith('-') and not line.startswith('---'):
                 console.print(f"[yellow]Warning: Failed to parse line: {line}[/yellow]")
         
+        self.__dict__.pop('by_category', None)
         self._content_loaded = True
     
     def load_applications(self) -> List[Application]:
         """Load applications from the GitHub repository."""
         if not self._content_loaded:
             content = self._fetch_content()
-            self.parse_content(content)
+            if parsed := _load_parsed('markdown', self._content_etag):
+                self.applications, self.categories = parsed
+                self.__dict__.pop('by_category', None)
+                self._content_loaded = True
+            else:
+                self.parse_content(content)
+                _save_parsed('markdown', self._content_etag, self.applications, self.categories)
         return self.applications
     
+    @cached_property
+    def by_category(self) -> Dict[str, List[Application]]:
+        """Applications grouped by category, built on first access."""
+        grouped = defaultdict(list)
+        for app in self.applications:
+            grouped[app.category].append(app)
+        return grouped
+    
     def _fetch_content(self) -> str:
         """Fetch content from GitHub repository."""
         if not hasattr(self, '_content_cache'):
             console.print("Fetching repository content...")
-            response = requests.get(
-                'https://raw.githubusercontent.com/awesome-selfhosted/awesome-selfhosted/master/README.md'
-            )
-            response.raise_for_status()
-            self._content_cache = response.text
+            self._content_cache, self._content_etag = _fetch_readme()
             console.print("First few lines of content:")
-            console.print('\n'.join(self._content_cache.split('\n')[:10]))
+            console.print('\n'.join(self._content_cache.split('\n', 10)[:10]))
         return self._content_cache
 
     # Regular expressions for parsing
@@ -317,17 +548,16 @@ class MarkdownParser:
     APP_PATTERN = r'^\s*-\s*(?:\[([^\]]+)\]\(([^)]+)\)|([^-\s][^\s]*))(?:\s*-\s*|\s+)(.*?)(?:\s*`([^`]+)`)?(?:\s*`([^`]+)`)?(?:\s*(?:\[[^\]]+\](?:\([^)]+\))?|\([^)]+\))*)?(?:\s*\([^)]+\))*\s*$'
     TOC_PATTERN = r'^\s*-\s*\[([^\]]+)\]\(#[^)]+\)\s*$'
     LICENSE_PATTERN = r'^\s*-\s*`([^`]+)`\s*-\s*\[([^\]]+)\]\(([^)]+)\)\s*$'
-    DOCKER_HUB_PATTERN = r'(?:hub\.docker\.com|docker\.io|quay\.io)/(?:r/)?[a-zA-Z0-9_-]+/[a-zA-Z0-9_-]+'
-    DOCKER_REFERENCE_PATTERN = r'(?:docker(?:ized|file|hub|compose)?|container(?:ized)?)'
+    DOCKER_HUB_PATTERN = _DOCKER_HUB_RE.pattern
+    DOCKER_REFERENCE_PATTERN = _DOCKER_REFERENCE_RE.pattern
     
     @staticmethod
     def extract_categories(content: str) -> List[str]:
         """Extract categories from markdown content."""
         categories = []
-        category_pattern = re.compile(r'^###\s+\[?([^\]]+)\]?')
         
-        for line in content.split('\n'):
-            if match := category_pattern.match(line.strip()):
+        for line in io.StringIO(content):
+            if match := _CATEGORY_LINE_RE.match(line.strip()):
                 categories.append(match.group(1))
         
         return categories
@@ -335,9 +565,11 @@ class MarkdownParser:
     @staticmethod
     def parse_application_line(line: str) -> Optional[Tuple[str, str, str, Optional[str], Optional[str]]]:
         """Parse a single application line."""
-        pattern = re.compile(r'^\s*-\s*\[([^\]]+)\]\(([^)]+)\)\s*-\s*(.+?)(?:\s*`([^`]+)`)?(?:\s*\[([^\]]+)\])?(?:\s*\([^)]+\))?\s*$')
+        result = _scan_application_line(line)
+        if result is not _UNDECIDED:
+            return result
         
-        if match := pattern.match(line):
+        if match := _APPLICATION_LINE_RE.match(line):
             name = match.group(1)
             url = match.group(2)
             desc = match.group(3).strip().rstrip('.')
@@ -349,19 +581,23 @@ class MarkdownParser:
         return None
     
     @staticmethod
-    def is_docker_url(url: str) -> bool:
-        """Check if the URL is likely a Docker-related URL."""
+    def is_docker_url(url: str, url_lower: Optional[str] = None) -> bool:
+        """Check if the URL is likely a Docker-related URL.
+        
+        ``url_lower`` may be passed by callers that already lowercased the URL.
+        """
         # Check for Docker registry URLs
-        if re.search(MarkdownParser.DOCKER_HUB_PATTERN, url):
+        if _DOCKER_HUB_RE.search(url):
             return True
             
         # Check for Docker-related words in URL
-        url_lower = url.lower()
-        if re.search(MarkdownParser.DOCKER_REFERENCE_PATTERN, url_lower):
+        if url_lower is None:
+            url_lower = url.lower()
+        if _DOCKER_REFERENCE_RE.search(url_lower):
             return True
             
         # Check for GitHub repositories with Docker-related names
-        if 'github.com' in url_lower and re.search(r'/docker-[a-zA-Z0-9-]+/?$', url_lower):
+        if 'github.com' in url_lower and _GITHUB_DOCKER_REPO_RE.search(url_lower):
             return True
             
         return False
@@ -369,48 +605,27 @@ class MarkdownParser:
     @staticmethod
     def has_docker_reference(text: str) -> bool:
         """Check if text contains Docker-related references."""
-        text_lower = text.lower()
-        
-        # Common Docker-related phrases
-        docker_phrases = [
-            'docker image',
-            'docker container',
-            'dockerized',
-            'docker-compose',
-            'dockerfile',
-            'docker hub',
-            'containerized',
-            'runs in docker',
-            'docker support',
-            'docker deployment',
-            'docker',
-            'container'
-        ]
-        
-        # Check for phrases
-        if any(phrase in text_lower for phrase in docker_phrases):
-            return True
-            
-        # Check for pattern matches
-        if re.search(MarkdownParser.DOCKER_REFERENCE_PATTERN, text_lower):
-            return True
-            
-        return False
+        # Every Docker phrase worth detecting ('docker image', 'dockerized',
+        # 'runs in docker', ...) contains 'docker' or 'container', so the one
+        # reference pattern covers them in a single scan
+        return _DOCKER_REFERENCE_RE.search(text.lower()) is not None
     
     @staticmethod
     def extract_docker_url(description: str, url: str) -> Optional[str]:
         """Extract Docker-related URL from description or main URL."""
         # Look for Docker registry URLs in description
-        if docker_match := re.search(MarkdownParser.DOCKER_HUB_PATTERN, description):
+        if docker_match := _DOCKER_HUB_RE.search(description):
             return f"https://{docker_match.group(0)}"
         
+        url_lower = url.lower()
+        
         # If description mentions Docker and we have a GitHub URL
         if MarkdownParser.has_docker_reference(description):
-            if 'github.com' in url.lower():
+            if 'github.com' in url_lower:
                 return url
         
         # Check if main URL is Docker-related
-        if MarkdownParser.is_docker_url(url):
+        if MarkdownParser.is_docker_url(url, url_lower):
             return url
             
         return None 
\ No newline at end of file
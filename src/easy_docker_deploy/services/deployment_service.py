@@ -1,22 +1,58 @@
 """
 Service layer for handling Docker deployments.
 """
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import functools
 import os
 import socket
 import subprocess
 import yaml
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 
 from ..config.settings import get_config
 from ..config.docker import DockerConfig
 from ..config.yaml_manager import YAMLManager
+from ..docker.manager import DockerManager, get_docker_manager
 from ..parser.github_parser import Application
 from ..utils.logging import get_logger, log_with_context
 from ..utils.exceptions import DeploymentError
 
 logger = get_logger(__name__)
 
+# Maps the characters _sanitize_name rewrites, applied in a single pass
+_NAME_TABLE = str.maketrans({" ": "-", ".": None, "_": "-"})
+
+# Kernel tables of TCP sockets on Linux
+_PROC_NET_TCP = ("/proc/net/tcp", "/proc/net/tcp6")
+
+def _bound_tcp_ports(tables: Tuple[str, ...] = _PROC_NET_TCP) -> Optional[Set[int]]:
+    """
+    Read the local ports of all TCP sockets from /proc/net.
+    
+    Args:
+        tables: Kernel socket tables to read
+        
+    Returns:
+        Set of ports in use, or None if the tables are unavailable (non-Linux)
+    """
+    ports = set()
+    tables_read = 0
+    for table in tables:
+        try:
+            with open(table) as f:
+                next(f, None)  # Header
+                for line in f:
+                    # Second column is the local address, "HEXIP:HEXPORT"
+                    local_address = line.split(None, 2)[1]
+                    ports.add(int(local_address.rpartition(":")[2], 16))
+        except FileNotFoundError:
+            continue  # tcp6 is absent when IPv6 is disabled
+        except (OSError, IndexError, ValueError):
+            return None
+        tables_read += 1
+    return ports if tables_read else None
+
 class PortAllocationError(DeploymentError):
     """Raised when a port cannot be allocated."""
     pass
@@ -36,6 +72,10 @@ class DeploymentService:
         self.config = get_config()
         self.base_dir = Path(self.config.default_volume_base).resolve()
         self.yaml_manager = YAMLManager(self.config.base_dir)
+        self._compose_cmd = (
+            *DockerManager.COMPOSE_CMD, "-f", str(self.yaml_manager.compose_file)
+        )
+        self._deployments_cache: Optional[Tuple[float, Dict[str, Path]]] = None
         
         # Common port mappings for well-known applications
         self.PORT_MAPPINGS = {
@@ -87,24 +127,16 @@ class DeploymentService:
             # Create Docker network if it doesn't exist
             network_name = self.config.default_network
             logger.info(f"Creating Docker network: {network_name}")
-            result = subprocess.run(
-                ["docker", "network", "create", network_name],
-                capture_output=True,
-                text=True
-            )
-            if result.returncode != 0 and "already exists" not in result.stderr:
-                raise DeploymentError(
-                    f"Failed to create Docker network: {result.stderr}"
-                )
+            get_docker_manager().ensure_network_exists(network_name)
             
             # Update configuration
             logger.info("Updating service configuration")
             self.yaml_manager.update_config(config)
             
-            # Deploy using docker-compose
+            # Deploy using docker compose
             logger.info("Starting Docker Compose deployment")
             result = subprocess.run(
-                ["docker-compose", "-f", str(self.yaml_manager.compose_file), "up", "-d"],
+                [*self._compose_cmd, "up", "-d"],
                 cwd=str(self.yaml_manager.base_dir),
                 capture_output=True,
                 text=True
@@ -151,12 +183,11 @@ class DeploymentService:
             # Create deployment directory
             deploy_dir = self._create_deployment_directory(app)
             
-            # Generate docker-compose.yml
+            # Generate docker-compose.yml; environment variables are inlined in it
             self._generate_compose_file(deploy_dir, config)
             
-            # Generate .env file if needed
-            if config.environment:
-                self._generate_env_file(deploy_dir, config.environment)
+            # A new compose file may not change the base directory mtime
+            self._deployments_cache = None
             
             logger.info(
                 "Deployment prepared successfully",
@@ -177,6 +208,70 @@ class DeploymentService:
             )
             raise DeploymentError(f"Failed to deploy {app.name}: {str(e)}") from e
     
+    def deploy_applications(self, apps: List[Application], max_workers: int = 32) -> Dict[str, bool]:
+        """
+        Deploy several applications, preparing their files concurrently.
+        
+        Args:
+            apps: Applications to deploy
+            max_workers: Maximum number of deployments prepared at once
+            
+        Returns:
+            Dictionary mapping application names to True
+            
+        Raises:
+            DeploymentError: If any deployment fails, after all have been attempted
+        """
+        if not apps:
+            return {}
+        
+        results = {}
+        errors = []
+        
+        # Directory and file creation is syscall-bound, so threads overlap it
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(apps))) as executor:
+            futures = {executor.submit(self.deploy_application, app): app for app in apps}
+            for future in as_completed(futures):
+                try:
+                    results[futures[future].name] = future.result()
+                except DeploymentError as e:
+                    errors.append(str(e))
+        
+        if errors:
+            raise DeploymentError("; ".join(errors))
+        
+        return results
+    
+    def get_deployment_directory(self, name: str) -> Path:
+        """Get the deployment directory for an application name."""
+        return self.base_dir / self._sanitize_name(name)
+    
+    def list_deployments(self) -> Dict[str, Path]:
+        """
+        List deployed applications.
+        
+        The directory scan is cached and only repeated when the modification
+        time of the deployments directory changes.
+        
+        Returns:
+            Dictionary mapping deployment names to their directories
+        """
+        try:
+            mtime = self.base_dir.stat().st_mtime
+        except FileNotFoundError:
+            return {}
+        
+        if self._deployments_cache and self._deployments_cache[0] == mtime:
+            return self._deployments_cache[1]
+        
+        deployments = {
+            deploy_dir.name: deploy_dir
+            for deploy_dir in sorted(self.base_dir.iterdir())
+            if (deploy_dir / "docker-compose.yml").is_file()
+        }
+        self._deployments_cache = (mtime, deployments)
+        return deployments
+    
     def _create_deployment_config(self, app: Application) -> DockerConfig:
         """Create deployment configuration for an application."""
         try:
@@ -232,31 +327,30 @@ class DeploymentService:
         compose_file = deploy_dir / "docker-compose.yml"
         try:
             with open(compose_file, 'w') as f:
-                f.write(config.to_compose_yaml())
+                config.write_compose(f)
         except Exception as e:
             raise ConfigurationError(f"Failed to generate docker-compose.yml: {str(e)}") from e
     
-    def _generate_env_file(self, deploy_dir: Path, env_vars: Dict[str, str]) -> None:
-        """Generate .env file."""
-        env_file = deploy_dir / ".env"
-        try:
-            with open(env_file, 'w') as f:
-                for key, value in env_vars.items():
-                    f.write(f"{key}={value}\n")
-        except Exception as e:
-            raise ConfigurationError(f"Failed to generate .env file: {str(e)}") from e
-    
     def _get_available_port(self, start_port: int) -> int:
         """Find the next available port starting from start_port."""
         port = start_port
         max_port = self.config.default_port_range[1]
         
+        bound_ports = None
+        
         while port <= max_port:
+            if bound_ports is not None and port in bound_ports:
+                port += 1
+                continue
             try:
                 with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
                     s.bind(('', port))
                     return port
             except OSError:
+                if bound_ports is None:
+                    # The suggested port is taken; read the kernel tables once so
+                    # further taken ports are skipped without a bind attempt each
+                    bound_ports = _bound_tcp_ports() or frozenset()
                 port += 1
         
         raise PortAllocationError(f"No available ports found in range {start_port}-{max_port}")
@@ -277,16 +371,21 @@ class DeploymentService:
         return self.ENV_VARS.get(lookup_name, {})
     
     @staticmethod
+    @functools.lru_cache(maxsize=1024)
     def _sanitize_name(name: str) -> str:
         """Sanitize a name for use in Docker and filesystem."""
-        return name.lower().replace(" ", "-").replace(".", "").replace("_", "-")
-
-# Global service instance
-_service: Optional[DeploymentService] = None
+        return name.lower().translate(_NAME_TABLE)
 
+@functools.lru_cache(maxsize=1)
 def get_deployment_service() -> DeploymentService:
-    """Get the global deployment service instance."""
-    global _service
-    if _service is None:
-        _service = DeploymentService()
-    return _service 
\ No newline at end of file
+    """
+    Get the global deployment service instance.
+    
+    The service is constructed on first call and reused for the rest of the
+    process, so configuration is only loaded once per CLI invocation.
+    """
+    return DeploymentService()
+
+def reset_deployment_service() -> None:
+    """Drop the cached deployment service so the next call builds a new one."""
+    get_deployment_service.cache_clear() 
\ No newline at end of file
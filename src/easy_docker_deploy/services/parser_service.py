@@ -3,6 +3,7 @@ Service layer for handling application parsing and caching.
 """
 import json
 import time
+from dataclasses import asdict
 from pathlib import Path
 from typing import Dict, List, Optional, Union
 
@@ -65,7 +66,8 @@ class ParserService:
             List of matching Application objects
         """
         apps = self.get_applications()
-        return [app for app in apps if app.matches_search(query)]
+        query = query.lower()
+        return [app for app in apps if query in app.search_text]
     
     def get_docker_ready_applications(self) -> List[Application]:
         """
@@ -135,7 +137,7 @@ class ParserService:
             # Save to cache
             with open(self._cache_file, 'w') as f:
                 json.dump(
-                    [app.__dict__ for app in applications],
+                    [asdict(app) for app in applications],
                     f,
                     indent=2
                 )
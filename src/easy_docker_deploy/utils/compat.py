@@ -0,0 +1,24 @@
+"""
+Compatibility helpers for the supported Python versions.
+"""
+import functools
+import sys
+
+# Keyword arguments that give dataclasses __slots__ where supported (3.10+)
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+@functools.lru_cache(maxsize=1)
+def yaml_safe_codec():
+    """
+    Get PyYAML's safe dumper and loader, the libyaml-based ones if built.
+    
+    PyYAML is imported on first call, so importing this module stays cheap.
+    
+    Returns:
+        Tuple of (SafeDumper, SafeLoader) classes
+    """
+    try:
+        from yaml import CSafeDumper as SafeDumper, CSafeLoader as SafeLoader
+    except ImportError:  # PyYAML built without libyaml
+        from yaml import SafeDumper, SafeLoader
+    return SafeDumper, SafeLoader
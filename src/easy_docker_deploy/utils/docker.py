@@ -7,6 +7,7 @@ import platform
 import os
 from pathlib import Path
 
+from ..docker.manager import DockerManager
 from .logging import get_logger
 
 logger = get_logger(__name__)
@@ -41,7 +42,7 @@ def check_docker_installation() -> bool:
             
         # Check Docker Compose
         result = subprocess.run(
-            ["docker-compose", "--version"],
+            [*DockerManager.COMPOSE_CMD, "version"],
             capture_output=True,
             text=True
         )
@@ -76,7 +77,7 @@ def get_docker_info() -> Tuple[bool, Optional[str], Optional[str]]:
         
         # Get Docker Compose version
         result = subprocess.run(
-            ["docker-compose", "--version"],
+            [*DockerManager.COMPOSE_CMD, "version"],
             capture_output=True,
             text=True
         )
@@ -16,6 +16,7 @@ from rich.layout import Layout
 from rich.box import ROUNDED
 from rich.text import Text
 
+from ..docker.manager import DockerManager
 from .logging import get_logger
 from .visualizer import ServiceVisualizer, DeploymentProgress
 
@@ -167,9 +168,9 @@ class YAMLManager:
         """
         try:
             with console.status("[bold yellow]Validating configuration...", spinner="dots"):
-                # Run docker-compose config
+                # Run docker compose config
                 result = subprocess.run(
-                    ["docker-compose", "-f", str(compose_file), "config"],
+                    [*DockerManager.COMPOSE_CMD, "-f", str(compose_file), "config"],
                     capture_output=True,
                     text=True,
                     check=True
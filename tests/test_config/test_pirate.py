@@ -149,4 +149,16 @@ def test_get_pirate_config_custom_path(base_path: Path) -> None:
             elif "/media" in volume:
                 assert str(base_path / "media") in volume
             elif "/downloads" in volume:
-                assert str(base_path / "downloads") in volume 
\ No newline at end of file
+                assert str(base_path / "downloads") in volume
+
+
+def test_get_pirate_config_environments_are_independent(base_path: Path) -> None:
+    """Test that editing one service's environment leaves the others alone."""
+    config = get_pirate_config(base_path, "Europe/Berlin")
+    environments = [service["environment"] for service in config["services"].values()]
+    
+    assert len({id(env) for env in environments}) == len(environments)
+    assert all(env["TZ"] == "Europe/Berlin" for env in environments)
+    
+    environments[0]["PUID"] = "1234"
+    assert all(env["PUID"] == "1000" for env in environments[1:])
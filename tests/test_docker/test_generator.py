@@ -0,0 +1,65 @@
+"""
+Tests for the Docker compose generator.
+"""
+import pytest
+import yaml
+
+from easy_docker_deploy.docker.generator import DockerComposeGenerator, DockerConfig
+
+@pytest.fixture
+def generator() -> DockerComposeGenerator:
+    """Create a compose generator."""
+    return DockerComposeGenerator()
+
+def test_generate_minimal_compose_file(generator: DockerComposeGenerator) -> None:
+    """Test that optional sections are omitted when empty."""
+    config = DockerConfig(image="nginx:latest", ports=[], volumes=[], environment={})
+
+    result = yaml.safe_load(generator.generate_compose_file("web", config))
+
+    assert result == {
+        "version": "3.8",
+        "services": {
+            "web": {
+                "image": "nginx:latest",
+                "container_name": "web",
+                "restart": "unless-stopped"
+            }
+        }
+    }
+
+def test_generate_full_compose_file(generator: DockerComposeGenerator) -> None:
+    """Test that the generated file parses back to the expected structure."""
+    config = DockerConfig(
+        image="ghcr.io/user/app:1.0",
+        ports=["8080:80", "53:53/udp"],
+        volumes=["/srv/app data:/data", "C:\\config:/config"],
+        environment={"TZ": "Etc/UTC", "MESSAGE": 'say "hi": #1 ✓'},
+        container_name="my-app"
+    )
+
+    result = yaml.safe_load(generator.generate_compose_file("app", config))
+
+    assert result["services"]["app"] == {
+        "image": "ghcr.io/user/app:1.0",
+        "container_name": "my-app",
+        "restart": "unless-stopped",
+        "ports": ["8080:80", "53:53/udp"],
+        "volumes": ["/srv/app data:/data", "C:\\config:/config"],
+        "environment": {"TZ": "Etc/UTC", "MESSAGE": 'say "hi": #1 ✓'}
+    }
+
+def test_generate_compose_file_non_bmp_characters(generator: DockerComposeGenerator) -> None:
+    """Test that characters outside the BMP survive a YAML round trip."""
+    config = DockerConfig(
+        image="nginx:latest",
+        ports=[],
+        volumes=["/m/\U0001F600:/d"],
+        environment={"GREETING": "hi \U0001F44B\u2028bye\x85"}
+    )
+
+    result = yaml.safe_load(generator.generate_compose_file("web", config))
+
+    service = result["services"]["web"]
+    assert service["volumes"] == ["/m/\U0001F600:/d"]
+    assert service["environment"] == {"GREETING": "hi \U0001F44B\u2028bye\x85"}
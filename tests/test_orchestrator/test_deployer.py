@@ -0,0 +1,42 @@
+"""
+Tests for the deployment orchestrator.
+"""
+import pytest
+
+from easy_docker_deploy.orchestrator.deployer import (
+    DeploymentError,
+    _parse_ports,
+    _parse_volumes
+)
+
+@pytest.mark.parametrize("port, expected", [
+    ("8080:80", {"80": "8080"}),
+    ("53:53/udp", {"53/udp": "53"}),
+    ("127.0.0.1:8080:80", {"80": ("127.0.0.1", "8080")}),
+    ("127.0.0.1:8080:80/tcp", {"80/tcp": ("127.0.0.1", "8080")}),
+    ("127.0.0.1::80", {"80": ("127.0.0.1", "")}),
+])
+def test_parse_ports(port: str, expected: dict) -> None:
+    """Test converting port strings to the SDK's ports mapping."""
+    assert _parse_ports([port]) == expected
+
+@pytest.mark.parametrize("port", ["80", ":80", "8080:", ""])
+def test_parse_ports_invalid(port: str) -> None:
+    """Test that malformed port strings are rejected."""
+    with pytest.raises(DeploymentError, match="Invalid port mapping"):
+        _parse_ports([port])
+
+@pytest.mark.parametrize("volume, expected", [
+    ("/srv/app:/data", {"/srv/app": {"bind": "/data", "mode": "rw"}}),
+    ("/srv/app:/data:ro", {"/srv/app": {"bind": "/data", "mode": "ro"}}),
+    ("app-data:/data:rw", {"app-data": {"bind": "/data", "mode": "rw"}}),
+])
+def test_parse_volumes(volume: str, expected: dict) -> None:
+    """Test converting volume strings to the SDK's volumes mapping."""
+    assert _parse_volumes([volume]) == expected
+
+@pytest.mark.parametrize("volume", ["/srv/app", ":/data", "/srv/app:", ""])
+def test_parse_volumes_invalid(volume: str) -> None:
+    """Test that malformed volume strings are rejected."""
+    with pytest.raises(DeploymentError, match="Invalid volume mapping"):
+        _parse_volumes([volume])
@@ -2,8 +2,9 @@
 Tests for the parser module.
 """
 import pytest
+from easy_docker_deploy.parser import markdown_parser
 from easy_docker_deploy.parser.markdown_parser import MarkdownParser
-from easy_docker_deploy.parser.github_parser import GithubParser, Application
+from easy_docker_deploy.parser.github_parser import GithubParser, Application, _github_repo
 
 def test_category_extraction():
     """Test category pattern matching."""
@@ -43,6 +44,25 @@ def test_application_line_parsing():
     assert lang is None
     assert license is None
 
+def test_application_line_trailing_groups():
+    """Test that only the final backtick/bracket/link groups are split off."""
+    line = ("- [Nextcloud](https://nextcloud.com) - Share files. "
+            "([Demo](https://demo.example), [Source Code](https://git.example)) `AGPL-3.0` `PHP`")
+    name, url, desc, lang, license = MarkdownParser.parse_application_line(line)
+    assert name == "Nextcloud"
+    assert desc == "Share files. ([Demo](https://demo.example), [Source Code](https://git.example)) `AGPL-3.0`"
+    assert lang == "PHP"
+    assert license is None
+    
+    line = "- [App](https://example.com) - Uses `docker` internally. `Go` [MIT] (https://example.com/demo)"
+    name, url, desc, lang, license = MarkdownParser.parse_application_line(line)
+    assert desc == "Uses `docker` internally"
+    assert lang == "Go"
+    assert license == "MIT"
+    
+    assert MarkdownParser.parse_application_line("- App - no link") is None
+    assert MarkdownParser.parse_application_line("- [App](https://example.com) no dash") is None
+
 def test_docker_url_detection():
     """Test Docker URL detection."""
     # Test Docker Hub URL
@@ -101,4 +121,33 @@ def test_github_parser_integration():
     
     # Test Docker-ready filtering
     docker_apps = parser.get_docker_ready_applications()
-    assert len(docker_apps) == 2 
\ No newline at end of file
+    assert len(docker_apps) == 2 
+
+def test_parsed_cache_keyed_by_parser_version(tmp_path, monkeypatch):
+    """Test that saved parse results are only reused by the same parser version."""
+    monkeypatch.setattr(markdown_parser, "_parsed_cache_file", lambda name: tmp_path / f"{name}.json")
+    app = markdown_parser.Application(name="App", url="https://app.com", description="Desc", category="Cat")
+    
+    markdown_parser._save_parsed("markdown", '"etag"', [app], {"Cat"})
+    assert markdown_parser._load_parsed("markdown", '"etag"') == ([app], {"Cat"})
+    assert markdown_parser._load_parsed("markdown", '"other"') is None
+    
+    monkeypatch.setattr(markdown_parser, "PARSED_CACHE_VERSION", markdown_parser.PARSED_CACHE_VERSION + 1)
+    assert markdown_parser._load_parsed("markdown", '"etag"') is None
+
+@pytest.mark.parametrize("url, expected", [
+    ("https://github.com/owner/repo", ("owner", "repo")),
+    ("https://github.com/owner/repo/", ("owner", "repo")),
+    ("https://github.com/owner/repo.git", ("owner", "repo")),
+    ("https://www.github.com/owner/repo/tree/main/docker", ("owner", "repo")),
+    ("http://github.com/owner/repo?tab=readme#install", ("owner", "repo")),
+    ("git@github.com:owner/repo.git", ("owner", "repo")),
+    ("https://github.com/owner/repo.github.io", ("owner", "repo.github.io")),
+    ("https://github.com/owner", None),
+    ("git@github.com:owner", None),
+    ("https://gitlab.com/owner/repo", None),
+    ("https://example.com/github.com/owner/repo", None),
+])
+def test_github_repo(url, expected):
+    """Test resolving owner and name from GitHub repository URLs."""
+    assert _github_repo(url) == expected
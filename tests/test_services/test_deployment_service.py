@@ -0,0 +1,41 @@
+"""
+Tests for the deployment service.
+"""
+from pathlib import Path
+
+from easy_docker_deploy.services.deployment_service import _bound_tcp_ports
+
+TCP_TABLE = """\
+  sl  local_address rem_address   st tx_queue rx_queue tr tm->when retrnsmt   uid  timeout inode
+   0: 00000000:1F90 00000000:0000 0A 00000000:00000000 00:00000000 00000000     0        0 1001 1 0000000000000000 100 0 0 10 0
+   1: 0100007F:0016 0100007F:A1B2 01 00000000:00000000 00:00000000 00000000  1000        0 1002 1 0000000000000000 20 4 30 10 -1
+"""
+
+TCP6_TABLE = """\
+  sl  local_address                         remote_address                        st tx_queue rx_queue tr tm->when retrnsmt   uid  timeout inode
+   0: 00000000000000000000000000000000:C350 00000000000000000000000000000000:0000 0A 00000000:00000000 00:00000000 00000000     0        0 1003 1 0000000000000000 100 0 0 10 0
+"""
+
+def test_bound_tcp_ports_parses_hex_ports(tmp_path: Path) -> None:
+    """Test that local ports are read from both IPv4 and IPv6 tables."""
+    tcp = tmp_path / "tcp"
+    tcp6 = tmp_path / "tcp6"
+    tcp.write_text(TCP_TABLE)
+    tcp6.write_text(TCP6_TABLE)
+    
+    assert _bound_tcp_ports((str(tcp), str(tcp6))) == {8080, 22, 50000}
+
+def test_bound_tcp_ports_missing_tables(tmp_path: Path) -> None:
+    """Test that a missing tcp6 table is skipped and no tables gives None."""
+    tcp = tmp_path / "tcp"
+    tcp.write_text(TCP_TABLE)
+    
+    assert _bound_tcp_ports((str(tcp), str(tmp_path / "tcp6"))) == {8080, 22}
+    assert _bound_tcp_ports((str(tmp_path / "missing"),)) is None
+
+def test_bound_tcp_ports_malformed_table(tmp_path: Path) -> None:
+    """Test that an unparsable table disables the shortcut."""
+    tcp = tmp_path / "tcp"
+    tcp.write_text("header\n   0: garbage\n")
+    
+    assert _bound_tcp_ports((str(tcp),)) is None